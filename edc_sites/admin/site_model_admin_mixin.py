@@ -3,13 +3,13 @@ from __future__ import annotations
 import collections
 from typing import TYPE_CHECKING, Type
 
+from django.conf import settings
 from django.contrib import admin
 from django.contrib.auth import get_permission_codename
-from django.core.exceptions import FieldError, ObjectDoesNotExist
+from django.core.exceptions import FieldError
 from django.db.models import QuerySet
 
-from ..models import SiteProfile
-from ..site import sites
+from ..site import SiteNotRegistered, sites
 from .list_filters import SiteListFilter
 
 if TYPE_CHECKING:
@@ -23,6 +23,13 @@ class SiteModeAdminMixinError(Exception):
     pass
 
 
+def get_read_replica() -> str | None:
+    """Returns the database alias of the read replica for multisite
+    viewers or None.
+    """
+    return getattr(settings, "EDC_SITES_READ_REPLICA", None)
+
+
 class SiteModelAdminMixin:
     language_db_field_name = "language"
 
@@ -63,10 +70,10 @@ class SiteModelAdminMixin:
     @admin.display(description="Site", ordering="site__id")
     def site_name(self, obj=None):
         try:
-            site_profile = SiteProfile.objects.get(site__id=obj.site.id)
-        except ObjectDoesNotExist:
+            single_site = sites.get(obj.site_id)
+        except SiteNotRegistered:
             return obj.site.name
-        return f"{site_profile.site.id} {site_profile.description}"
+        return f"{single_site.site_id} {single_site.description}"
 
     def get_list_filter(self, request) -> tuple[str | Type[SimpleListFilter], ...]:
         """Insert `SiteListFilter` before field name `created`.
@@ -114,8 +121,28 @@ class SiteModelAdminMixin:
                 f"Model missing field `site`. Model `{self.model}`. Did you mean to use "
                 f"the SiteModelAdminMixin? See `{self}`."
             )
+        if len(site_ids) > 1 and (alias := self.get_read_replica_alias(request)):
+            qs = qs.using(alias)
         return qs
 
+    def get_read_replica_alias(self, request) -> str | None:
+        """Returns settings.EDC_SITES_READ_REPLICA if the user is a
+        multisite viewer or None.
+
+        `sites.get_view_only_site_ids_for_user` only returns other
+        sites for a multisite viewer without add, change or delete
+        permissions, so the queryset is read only. Users with the
+        "viewallsites" codename are not routed.
+        """
+        alias = get_read_replica()
+        if (
+            alias
+            and getattr(request.user.userprofile, "is_multisite_viewer", False)
+            and not self.has_viewallsites_permission(request)
+        ):
+            return alias
+        return None
+
     def get_form(self, request, obj=None, change=False, **kwargs):
         """Add current_site attr to form instance"""
         form = super().get_form(request, obj=obj, change=change, **kwargs)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Iterator
+
+from django.conf import settings
+
+from .site_identity_map import site_identity_map
+from .utils.get_site_model_cls import get_site_model_cls
+
+if TYPE_CHECKING:
+    from django.contrib.sites.models import Site
+
+__all__ = [
+    "get_current_site_id",
+    "get_current_site_obj",
+    "get_site_id_override",
+    "get_site_obj",
+    "use_site",
+]
+
+_site_id_override: ContextVar[int | None] = ContextVar("edc_sites_site_id", default=None)
+
+
+def get_site_id_override() -> int | None:
+    """Returns the site_id set by `use_site` in this context or None."""
+    return _site_id_override.get()
+
+
+def get_current_site_id() -> int:
+    """Returns the site_id set by `use_site` or settings.SITE_ID."""
+    site_id = get_site_id_override()
+    return int(settings.SITE_ID) if site_id is None else site_id
+
+
+def get_site_obj(site_id: int) -> Site:
+    """Returns a Site model instance from the SiteIdentityMap.
+
+    Falls back to the DB if the site_id is not in the map.
+    """
+    return site_identity_map.get(site_id) or get_site_model_cls().objects.get(id=site_id)
+
+
+def get_current_site_obj() -> Site:
+    """Returns the Site model instance set by `use_site` or the
+    current site from `SiteManager.get_current()`.
+    """
+    site_id = get_site_id_override()
+    if site_id is None:
+        return get_site_model_cls().objects.get_current()
+    return get_site_obj(site_id)
+
+
+@contextmanager
+def use_site(site_id: int | Site) -> Iterator[int]:
+    """Context manager to override the current site.
+
+    Honoured by `SiteModelMixin.get_site_on_create`, the
+    `on_site` manager and `sites.get_current_site`. The override is
+    held in a contextvar so each thread and asyncio task sees only
+    its own value. For example:
+
+        for site_id in sites.all():
+            with use_site(site_id):
+                MyModel.objects.create(...)
+    """
+    site_id = int(getattr(site_id, "id", site_id))
+    token = _site_id_override.set(site_id)
+    try:
+        yield site_id
+    finally:
+        _site_id_override.reset(token)
@@ -0,0 +1,89 @@
+import dataclasses
+import sys
+from importlib.util import find_spec
+
+from django.apps import apps as django_apps
+from django.core.management.base import BaseCommand
+from django.core.management.color import color_style
+from django.db import OperationalError
+
+from edc_sites.post_migrate_signals import post_migrate_update_sites
+from edc_sites.site import SitesCheckError
+from edc_sites.site import sites as site_sites
+from edc_sites.startup_profiler import startup_profiler
+from edc_sites.system_checks import compare_single_sites_with_db
+
+style = color_style()
+
+
+class Command(BaseCommand):
+    help = "Profile wall time and query counts of each edc_sites startup phase"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--module-name",
+            default="sites",
+            dest="module_name",
+            help="Name of the module to autodiscover. Default: sites",
+        )
+
+        parser.add_argument(
+            "--include-post-migrate",
+            default=False,
+            action="store_true",
+            dest="include_post_migrate",
+            help="Also run `post_migrate_update_sites`. Writes to the Site tables.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        sys.stdout.write("\n Edc Sites : Profiling startup phases ...\n")
+        startup_profiler.force_enabled = True
+        startup_profiler.reset()
+        registry, loaded = site_sites.all(), site_sites.loaded
+        try:
+            self.profile_autodiscover(options.get("module_name"))
+        finally:
+            site_sites._registry, site_sites.loaded = registry, loaded
+            site_sites.registry_version += 1
+        self.profile_single_sites()
+        self.profile_sites_check()
+        if options.get("include_post_migrate"):
+            post_migrate_update_sites()
+        startup_profiler.report()
+        startup_profiler.reset()
+        startup_profiler.force_enabled = False
+        sys.stdout.write("Done     \n")
+
+    @staticmethod
+    def profile_autodiscover(module_name: str) -> None:
+        """Re-imports each `sites` module on an empty registry.
+
+        The registry in use before profiling is restored by the
+        caller.
+        """
+        for app in django_apps.app_configs:
+            try:
+                if find_spec(f"{app}.{module_name}"):
+                    sys.modules.pop(f"{app}.{module_name}", None)
+            except ImportError:
+                pass
+        site_sites._registry = {}
+        site_sites.registry_version += 1
+        site_sites.loaded = False
+        site_sites.autodiscover(module_name=module_name, verbose=False)
+
+    @staticmethod
+    def profile_single_sites() -> None:
+        """Re-creates each registered SingleSite to run language
+        resolution in `__post_init__`.
+        """
+        for single_site in site_sites.all(aslist=True):
+            dataclasses.replace(single_site)
+
+    @staticmethod
+    def profile_sites_check() -> None:
+        with startup_profiler.phase("sites_check"):
+            try:
+                compare_single_sites_with_db()
+            except (SitesCheckError, OperationalError) as e:
+                sys.stdout.write(style.WARNING(f"   sites_check: {e}\n"))
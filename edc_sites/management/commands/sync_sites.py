@@ -1,12 +1,24 @@
-import socket
+import dataclasses
+import json
 import sys
 
 from django.conf import settings
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.core.management.color import color_style
 
+from edc_sites.registry_snapshot import write_registry_snapshot
 from edc_sites.site import sites as site_sites
-from edc_sites.utils import add_or_update_django_sites
+from edc_sites.startup_profiler import StartupProfiler
+from edc_sites.utils import (
+    SitesDiff,
+    add_or_update_django_sites,
+    apply_sites_diff,
+    get_allowed_hosts,
+    get_sites_diff,
+    resolve_hosts,
+    sync_multisite_aliases,
+    validate_resolve_options,
+)
 
 style = color_style()
 
@@ -14,6 +26,13 @@ style = color_style()
 class Command(BaseCommand):
     help = "Add / Update django Site model after changes to edc_sites"
 
+    # callable that takes a domain and returns an address or raises
+    # OSError. Defaults to socket.gethostbyname. See resolve_hosts.
+    host_resolver = None
+    as_json = False
+    profiler = None
+    report = None
+
     def add_arguments(self, parser):
 
         parser.add_argument(
@@ -24,6 +43,22 @@ class Command(BaseCommand):
             help="Try to ping hosts",
         )
 
+        parser.add_argument(
+            "--ping-concurrency",
+            default=20,
+            type=int,
+            dest="ping_concurrency",
+            help="Maximum number of concurrent host lookups. Default: 20",
+        )
+
+        parser.add_argument(
+            "--ping-timeout",
+            default=5.0,
+            type=float,
+            dest="ping_timeout",
+            help="Timeout in seconds to wait for the host lookups. Default: 5.0",
+        )
+
         parser.add_argument(
             "--suggest-hosts",
             default=False,
@@ -32,48 +67,232 @@ class Command(BaseCommand):
             help="Suggest ALLOWED_HOSTS",
         )
 
+        parser.add_argument(
+            "--compact-hosts",
+            default=False,
+            action="store_true",
+            dest="compact_hosts",
+            help="Collapse sibling domains into `.parent.domain` in suggested ALLOWED_HOSTS",
+        )
+
+        parser.add_argument(
+            "--uat-hosts",
+            default=False,
+            action="store_true",
+            dest="uat_hosts",
+            help="Include the UAT (or live) variant of each domain in suggested ALLOWED_HOSTS",
+        )
+
+        parser.add_argument(
+            "--dry-run",
+            default=False,
+            action="store_true",
+            dest="dry_run",
+            help="Show changes to the Site and SiteProfile tables but do not apply them",
+        )
+
+        parser.add_argument(
+            "--diff",
+            default=False,
+            action="store_true",
+            dest="diff",
+            help="Show changes to the Site and SiteProfile tables and apply only those",
+        )
+
+        parser.add_argument(
+            "--uat-aliases",
+            default=False,
+            action="store_true",
+            dest="uat_aliases",
+            help="Multisite. Also add the UAT (or live) domain of each site as an alias",
+        )
+
+        parser.add_argument(
+            "--list-aliases",
+            default=False,
+            action="store_true",
+            dest="list_aliases",
+            help="Multisite. List each alias after syncing",
+        )
+
+        parser.add_argument(
+            "--format",
+            default="text",
+            choices=["text", "json"],
+            dest="format",
+            help="Output format. Use `json` for a single machine-readable document",
+        )
+
+        parser.add_argument(
+            "--output",
+            default=None,
+            dest="output",
+            metavar="PATH",
+            help="With `--format json`, write the document to PATH instead of stdout",
+        )
+
+        parser.add_argument(
+            "--write-snapshot",
+            default=None,
+            dest="write_snapshot",
+            metavar="PATH",
+            help=(
+                "Write a registry snapshot to PATH. "
+                "See also settings.EDC_SITES_REGISTRY_SNAPSHOT"
+            ),
+        )
+
     def handle(self, *args, **options) -> None:
-        sys.stdout.write("\n\n")
-        sys.stdout.write(" Edc Sites : Adding / Updating sites ...     \n")
-        add_or_update_django_sites(verbose=True)
-        if (
+        try:
+            validate_resolve_options(
+                options.get("ping_concurrency"), options.get("ping_timeout")
+            )
+        except ValueError as e:
+            raise CommandError(f"Invalid --ping-concurrency or --ping-timeout. {e}")
+        self.as_json = options.get("format") == "json"
+        if options.get("output") and not self.as_json:
+            raise CommandError("Invalid --output. Expected --format json.")
+        self.profiler = StartupProfiler(force_enabled=True, report_at_exit=False)
+        if options.get("write_snapshot") and site_sites.snapshot_path:
+            # do not write a snapshot from a registry read from a snapshot.
+            # The sites modules were not imported, autodiscover them now.
+            with self.profiler.phase("autodiscover"):
+                site_sites.initialize()
+                site_sites.autodiscover(verbose=False, use_snapshot=False)
+        self.report = dict(registry_size=len(site_sites.all()))
+        self.write("\n\n")
+        self.write(" Edc Sites : Adding / Updating sites ...     \n")
+        self.update_sites(dry_run=options.get("dry_run"), diff_only=options.get("diff"))
+        if not options.get("dry_run") and (
             "multisite" in settings.INSTALLED_APPS
             or "multisite.apps.AppConfig" in settings.INSTALLED_APPS
         ):
-            from multisite.models import Alias
-            from multisite.utils import create_or_sync_canonical_from_all_sites
+            self.update_aliases(
+                include_uat=options.get("uat_aliases"),
+                list_aliases=options.get("list_aliases"),
+            )
+        self.write_allowed_hosts(
+            compact=options.get("compact_hosts"), include_uat=options.get("uat_hosts")
+        )
+        if options.get("ping_hosts"):
+            self.ping_hosts(
+                concurrency=options.get("ping_concurrency"),
+                timeout=options.get("ping_timeout"),
+            )
+        if path := options.get("write_snapshot"):
+            snapshot_hash = write_registry_snapshot(path, site_sites.all(aslist=True))
+            self.report.update(snapshot=dict(path=str(path), hash=snapshot_hash))
+            self.write(f"\n Wrote registry snapshot to {path} (hash={snapshot_hash})\n")
+        self.report.update(
+            phases=[dataclasses.asdict(stats) for stats in self.profiler.phases.values()]
+        )
+        if self.as_json:
+            document = json.dumps(self.report, indent=2)
+            if path := options.get("output"):
+                with open(path, "w") as f:
+                    f.write(f"{document}\n")
+            else:
+                self.stdout.write(document)
+        else:
+            self.write("Done     \n")
 
-            sys.stdout.write("\n Multisite. \n")
-            create_or_sync_canonical_from_all_sites(verbose=True)
+    def update_sites(self, dry_run: bool, diff_only: bool) -> None:
+        if not (dry_run or diff_only or self.as_json):
+            # the diff is not reported, add or update each site
+            with self.profiler.phase("add_or_update_django_sites"):
+                add_or_update_django_sites(verbose=True)
+            return
+        with self.profiler.phase("sites_diff"):
+            diff = get_sites_diff()
+        self.report.update(
+            rows_changed=len(diff.changed_single_sites) + len(diff.site_deletes),
+            changes=diff.as_lines(),
+            dry_run=dry_run,
+        )
+        if dry_run or diff_only:
+            self.write_diff(diff)
+        if dry_run:
+            self.write(style.WARNING("  * dry run. No changes applied.\n"))
+            return
+        with self.profiler.phase("apply_sites_diff"):
+            changed = apply_sites_diff(diff)
+        self.write(f"  * applied changes to {changed} site(s).\n")
+        # invalidated by the post_save and post_delete receivers
+        self.report.update(
+            cache_invalidated=sorted(
+                [s.site_id for s in diff.changed_single_sites]
+                + [site_id for site_id, _ in diff.site_deletes]
+            )
+        )
 
-            sys.stdout.write("    multisite.Alias \n")
-            for obj in Alias.objects.all():
-                sys.stdout.write(
-                    f"      - Site model: {obj.site.id}: {obj.domain} "
+    def update_aliases(self, include_uat: bool, list_aliases: bool) -> None:
+        from multisite.models import Alias
+
+        self.write("\n Multisite. \n")
+        with self.profiler.phase("sync_multisite_aliases"):
+            result = sync_multisite_aliases(include_uat=include_uat)
+        self.report.update(aliases=dataclasses.asdict(result))
+        self.write(f"    multisite.Alias: {result}\n")
+        if list_aliases:
+            for obj in Alias.objects.order_by("site_id", "domain"):
+                self.write(
+                    f"      - Site model: {obj.site_id}: {obj.domain} "
                     f"is_canonical={obj.is_canonical}.\n"
                 )
+
+    def write_allowed_hosts(self, compact: bool, include_uat: bool) -> None:
         arg = [arg for arg in sys.argv if arg.startswith("--settings")]
-        sys.stdout.write(f"\n Settings: reading from {arg}")
-        sys.stdout.write("\n\n Current value of settings.ALLOWED_HOSTS\n")
-        sys.stdout.write(style.WARNING(f"\n    DEBUG = {settings.DEBUG}\n"))
-        sys.stdout.write("    ALLOWED_HOSTS = [\n")
+        self.write(f"\n Settings: reading from {arg}")
+        self.write("\n\n Current value of settings.ALLOWED_HOSTS\n")
+        self.write(style.WARNING(f"\n    DEBUG = {settings.DEBUG}\n"))
+        self.write("    ALLOWED_HOSTS = [\n")
         for host in settings.ALLOWED_HOSTS:
-            sys.stdout.write(f"      {host},\n")
-        sys.stdout.write("    ]\n")
-        sys.stdout.write("\n Suggested settings.ALLOWED_HOSTS\n\n")
-        sys.stdout.write("    ALLOWED_HOSTS = [\n")
-        for single_site in site_sites.all(aslist=True):
-            sys.stdout.write(f"      {single_site.domain},\n")
-        sys.stdout.write("    ]\n")
-        if options.get("ping_hosts"):
-            sys.stdout.write("\n Looking up hosts:\n")
-            for single_site in site_sites.all(aslist=True):
-                try:
-                    host = socket.gethostbyname(single_site.domain)
-                except socket.gaierror as e:
-                    sys.stdout.write(
-                        style.ERROR(f"  {single_site.domain}: <not found>. Got {e}\n")
+            self.write(f"      {host},\n")
+        self.write("    ]\n")
+        allowed_hosts = get_allowed_hosts(compact=compact, include_uat=include_uat)
+        self.report.update(
+            allowed_hosts=list(settings.ALLOWED_HOSTS),
+            suggested_allowed_hosts=allowed_hosts.hosts,
+            allowed_hosts_compaction_ratio=allowed_hosts.ratio,
+        )
+        self.write("\n Suggested settings.ALLOWED_HOSTS\n\n")
+        self.write("    ALLOWED_HOSTS = [\n")
+        for host in allowed_hosts.hosts:
+            self.write(f"      {host},\n")
+        self.write("    ]\n")
+        self.write(f"    # {allowed_hosts}\n")
+
+    def ping_hosts(self, concurrency: int, timeout: float) -> None:
+        self.write("\n Looking up hosts:\n")
+        with self.profiler.phase("resolve_hosts"):
+            resolutions = resolve_hosts(
+                [single_site.domain for single_site in site_sites.all(aslist=True)],
+                resolver=self.host_resolver,
+                concurrency=concurrency,
+                timeout=timeout,
+            )
+        self.report.update(hosts=[dataclasses.asdict(r) for r in resolutions])
+        for resolution in resolutions:
+            latency = f"{resolution.latency * 1000:.0f}ms"
+            if resolution.ok:
+                self.write(
+                    f"  {resolution.domain}: {resolution.address} "
+                    f"{style.SUCCESS('OK')} ({latency})\n"
+                )
+            else:
+                self.write(
+                    style.ERROR(
+                        f"  {resolution.domain}: <not found>. "
+                        f"Got {resolution.error} ({latency})\n"
                     )
-                else:
-                    sys.stdout.write(f"  {single_site.domain}: {host} {style.SUCCESS('OK')}\n")
-        sys.stdout.write("Done     \n")
+                )
+
+    def write(self, text: str) -> None:
+        if not self.as_json:
+            self.stdout.write(text, ending="")
+
+    def write_diff(self, diff: SitesDiff) -> None:
+        if not diff.has_changes:
+            self.write("  * Site and SiteProfile are up to date.\n")
+        for line in diff.as_lines():
+            self.write(f"    {line}\n")
@@ -1,8 +1,80 @@
+from __future__ import annotations
+
 from django.contrib.sites.managers import CurrentSiteManager as BaseCurrentSiteManager
+from django.db import models
+from django.db.models import Case, CharField, Value, When
+
+from .current_site import get_current_site_id
+
+__all__ = ["CurrentSiteManager", "SiteModelManager", "SiteQuerySet"]
+
+
+class SiteQuerySet(models.QuerySet):
+    """A QuerySet for models with a `site` foreign key.
+
+    Site metadata is annotated and filtered from the `sites` registry
+    on `site_id` so the query does not join `django_site` or
+    `edc_sites_siteprofile`.
+    """
+
+    def annotate_from_registry(self, name: str, attrname: str) -> SiteQuerySet:
+        """Annotates `name` with a registry attribute of the site,
+        e.g. `country`, using one WHEN per distinct value.
+        """
+        from .site import sites  # prevent circular import
+
+        site_ids_by_value: dict[str, list[int]] = {}
+        for single_site in sites.all(aslist=True):
+            site_ids_by_value.setdefault(getattr(single_site, attrname), []).append(
+                single_site.site_id
+            )
+        whens = [
+            When(site_id__in=site_ids, then=Value(value))
+            for value, site_ids in site_ids_by_value.items()
+        ]
+        if not whens:
+            return self.annotate(**{name: Value(None, output_field=CharField())})
+        return self.annotate(**{name: Case(*whens, default=None, output_field=CharField())})
+
+    def with_site_name(self, name: str | None = None) -> SiteQuerySet:
+        return self.annotate_from_registry(name or "site_name", "name")
+
+    def with_site_description(self, name: str | None = None) -> SiteQuerySet:
+        return self.annotate_from_registry(name or "site_description", "description")
 
+    def with_country(self, name: str | None = None) -> SiteQuerySet:
+        return self.annotate_from_registry(name or "site_country", "country")
+
+    def on_country(self, country: str) -> SiteQuerySet:
+        """Filters on the site_ids registered for this country."""
+        from .site import sites  # prevent circular import
+
+        return self.filter(site_id__in=list(sites.get_by_country(country)))
+
+
+class SiteModelManager(models.Manager.from_queryset(SiteQuerySet)):
+    """A manager for models with a `site` foreign key that adds the
+    SiteQuerySet methods, e.g. `on_country`.
+    """
+
+    pass
+
+
+class CurrentSiteManager(BaseCurrentSiteManager.from_queryset(SiteQuerySet)):
+    """Limits the queryset to the current site.
+
+    The current site is settings.SITE_ID unless overridden with
+    `sites.use_site`. See also SiteQuerySet.
+    """
 
-class CurrentSiteManager(BaseCurrentSiteManager):
     use_in_migrations = True
 
+    def get_queryset(self):
+        return (
+            super(BaseCurrentSiteManager, self)
+            .get_queryset()
+            .filter(**{f"{self._get_field_name()}__id": get_current_site_id()})
+        )
+
     def get_by_natural_key(self, subject_identifier):
         return self.get(subject_identifier=subject_identifier)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from django.contrib.sites.shortcuts import get_current_site
+from django.db import DEFAULT_DB_ALIAS
+
+from .site import sites
+from .utils import get_site_model_cls
+
+
+class SiteRegistryMiddleware:
+    """Sets `request.site` from the `sites` registry without a
+    database query.
+
+    Use in place of `django.contrib.sites.middleware.CurrentSiteMiddleware`.
+    The Site instance is built from the registered SingleSite. Hosts
+    not in the registry fall back to `get_current_site`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if single_site := sites.get_by_domain(request.get_host()):
+            site = get_site_model_cls()(
+                id=single_site.site_id, name=single_site.name, domain=single_site.domain
+            )
+            site._state.adding = False
+            site._state.db = DEFAULT_DB_ALIAS
+            request.site = site
+        else:
+            request.site = get_current_site(request)
+        return self.get_response(request)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from django.db import models
+from django.db.models.fields.related_descriptors import ForwardManyToOneDescriptor
+
+from .site_identity_map import get_site_identity_map_enabled, site_identity_map
+
+__all__ = ["SiteForeignKey"]
+
+
+class SiteForwardManyToOneDescriptor(ForwardManyToOneDescriptor):
+    """Resolves `obj.site` from the SiteIdentityMap instead of
+    querying the DB.
+    """
+
+    def get_object(self, instance, *args, **kwargs):
+        if get_site_identity_map_enabled():
+            site = site_identity_map.get(
+                getattr(instance, self.field.attname), using=instance._state.db
+            )
+            if site is not None:
+                return site
+        return super().get_object(instance, *args, **kwargs)
+
+
+class SiteForeignKey(models.ForeignKey):
+    """A ForeignKey to Site that resolves the related Site from the
+    SiteIdentityMap.
+
+    Deconstructs as a ForeignKey so migrations are not affected.
+    Set settings.EDC_SITES_SITE_IDENTITY_MAP=False to query the DB.
+    """
+
+    forward_related_accessor_class = SiteForwardManyToOneDescriptor
+
+    def deconstruct(self):
+        name, _, args, kwargs = super().deconstruct()
+        return name, "django.db.models.ForeignKey", args, kwargs
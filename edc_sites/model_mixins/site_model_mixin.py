@@ -6,9 +6,9 @@ from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models, transaction
 
+from ..current_site import get_current_site_obj
 from ..managers import CurrentSiteManager
-from ..site import sites
-from ..utils import get_site_model_cls
+from ..model_fields import SiteForeignKey
 
 if TYPE_CHECKING:
     from django.contrib.sites.models import Site
@@ -19,7 +19,7 @@ class SiteModelMixinError(Exception):
 
 
 class SiteModelMixin(models.Model):
-    site = models.ForeignKey(
+    site = SiteForeignKey(
         "sites.site",
         on_delete=models.PROTECT,
         null=True,
@@ -44,14 +44,16 @@ class SiteModelMixin(models.Model):
     def get_site_on_create(self) -> Site:
         """Returns a site model instance.
 
-        See also django-multisite.
+        See also django-multisite and `sites.use_site`.
         """
         site = None
         if not self.site:
             try:
                 with transaction.atomic():
-                    site = get_site_model_cls().objects.get_current()
+                    site = get_current_site_obj()
             except ObjectDoesNotExist as e:
+                from ..site import sites  # prevent circular import
+
                 site_ids = [str(s) for s in sites.all()]
                 raise SiteModelMixinError(
                     "Exception raised when trying manager method `get_current()`. "
@@ -1,18 +1,71 @@
+import logging
 import sys
 
 from django.core.management.color import color_style
 
 style = color_style()
 
+logger = logging.getLogger(__name__)
 
-def post_migrate_update_sites(sender=None, **kwargs):
+
+class MigrateCall:
+    """Remembers the `apps` and `plan` kwargs `migrate` sends with
+    post_migrate so that sites are updated once per `migrate` call.
+    """
+
+    def __init__(self):
+        self.apps = None
+        self.plan = None
+        self.skipped = 0
+
+    def seen(self, apps, plan) -> bool:
+        """Returns True if this `apps` and `plan` were already seen,
+        otherwise remembers them and returns False.
+
+        `plan` is None when called directly or by `flush`, in which case
+        this always returns False. `flush` sends post_migrate once for
+        each installed app, so sites are fully updated once per app.
+        """
+        if plan is not None and apps is self.apps and plan is self.plan:
+            self.skipped += 1
+            return True
+        self.apps, self.plan, self.skipped = apps, plan, 0
+        return False
+
+
+migrate_call = MigrateCall()
+
+
+def post_migrate_update_sites(sender=None, apps=None, plan=None, **kwargs):
+    """Updates the Site and SiteProfile models from the `sites` global.
+
+    `migrate` sends post_migrate once for each installed app with the
+    same `apps` and `plan`. Sites are updated on the first call and
+    the later calls of the same `migrate` are skipped. The receiver
+    may be connected with or without a `sender` filter.
+
+    `flush` sends post_migrate without a `plan`, so each of its calls
+    updates the sites.
+    """
     from .site import sites as site_sites
+    from .startup_profiler import startup_profiler
     from .utils import add_or_update_django_sites
 
+    if migrate_call.seen(apps, plan):
+        if migrate_call.skipped == 1:
+            logger.debug(
+                "post_migrate_update_sites: sites already updated for this migrate. "
+                "Skipping the remaining post_migrate calls."
+            )
+        return
     sys.stdout.write(style.MIGRATE_HEADING("Updating sites:\n"))
-
-    for country in site_sites.countries:
-        sys.stdout.write(style.MIGRATE_HEADING(f" (*) sites for {country} ...\n"))
-        add_or_update_django_sites(verbose=True)
+    if site_sites.all():
+        with startup_profiler.phase("post_migrate_update_sites"):
+            sys.stdout.write(
+                style.MIGRATE_HEADING(
+                    f" (*) sites for {', '.join(sorted(site_sites.countries))} ...\n"
+                )
+            )
+            add_or_update_django_sites(verbose=True)
     sys.stdout.write("Done.\n")
     sys.stdout.flush()
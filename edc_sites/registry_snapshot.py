@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+from importlib.util import find_spec
+from pathlib import Path
+
+from .single_site import SingleSite
+from .single_site.get_languages_from_settings import get_languages_from_settings
+
+__all__ = [
+    "RegistrySnapshotError",
+    "SNAPSHOT_VERSION",
+    "get_sites_module_hashes",
+    "get_snapshot_hash",
+    "read_registry_snapshot",
+    "write_registry_snapshot",
+]
+
+SNAPSHOT_VERSION = 1
+
+
+class RegistrySnapshotError(Exception):
+    pass
+
+
+def get_snapshot_settings() -> dict:
+    """Returns the settings used to build the registry.
+
+    Included in the hash so that a snapshot written under different
+    settings is not loaded.
+    """
+    from .site import get_insert_uat_subdomain  # prevent circular import
+
+    return dict(
+        languages=get_languages_from_settings(),
+        uat_subdomain=bool(get_insert_uat_subdomain()),
+    )
+
+
+def get_sites_module_hashes(module_name: str | None = None) -> dict[str, str]:
+    """Returns a dict of {module: sha256 of its file} for the `sites`
+    module of each installed app, as found by `autodiscover`.
+
+    Included in the hash so that a snapshot is not loaded after a
+    `sites` module changed.
+    """
+    from django.apps import apps as django_apps
+
+    module_name = module_name or "sites"
+    hashes = {}
+    for app in django_apps.app_configs:
+        try:
+            spec = find_spec(f"{app}.{module_name}")
+        except ImportError:
+            continue
+        if spec and spec.origin and Path(spec.origin).is_file():
+            hashes[spec.name] = hashlib.sha256(Path(spec.origin).read_bytes()).hexdigest()
+    return hashes
+
+
+def get_snapshot_hash(data: list[dict]) -> str:
+    content = json.dumps(
+        dict(
+            version=SNAPSHOT_VERSION,
+            settings=get_snapshot_settings(),
+            modules=get_sites_module_hashes(),
+            sites=data,
+        ),
+        sort_keys=True,
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def write_registry_snapshot(path: Path | str, single_sites: list[SingleSite]) -> str:
+    """Writes the given registered SingleSites to a JSON file and
+    returns the content hash.
+
+    Domains are written as registered, that is, with the UAT
+    subdomain already inserted, if applicable.
+    """
+    data = [dataclasses.asdict(single_site) for single_site in single_sites]
+    snapshot_hash = get_snapshot_hash(data)
+    with Path(path).open("w") as f:
+        json.dump(dict(version=SNAPSHOT_VERSION, hash=snapshot_hash, sites=data), f)
+    return snapshot_hash
+
+
+def read_registry_snapshot(path: Path | str) -> list[SingleSite]:
+    """Returns a list of SingleSites read from the snapshot file or
+    raises.
+
+    `__post_init__` is not called, the languages and description
+    stored in the snapshot are used as is. Raises if the version or
+    hash does not match.
+    """
+    try:
+        with Path(path).open() as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError) as e:
+        raise RegistrySnapshotError(f"Unable to read registry snapshot. Got {e}.")
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        raise RegistrySnapshotError(
+            f"Invalid registry snapshot version. Expected {SNAPSHOT_VERSION}. "
+            f"Got {snapshot.get('version')}."
+        )
+    data = snapshot.get("sites") or []
+    if snapshot.get("hash") != get_snapshot_hash(data):
+        raise RegistrySnapshotError(
+            "Registry snapshot hash does not match. The snapshot is corrupt or was "
+            f"written with different settings or sites modules. Got {path}."
+        )
+    field_names = [f.name for f in dataclasses.fields(SingleSite)]
+    single_sites = []
+    for attrs in data:
+        single_site = SingleSite.__new__(SingleSite)
+        single_site.__dict__.update({k: attrs[k] for k in field_names})
+        single_sites.append(single_site)
+    return single_sites
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Type
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from .current_site import get_current_site_id
+from .site_identity_map import site_identity_map
+from .utils.get_site_model_cls import get_site_model_cls
+
+if TYPE_CHECKING:
+    from django.db.models import Model, QuerySet
+
+__all__ = [
+    "SiteShardRouter",
+    "fan_out",
+    "get_database_shards",
+    "get_shard_for_site",
+    "get_site_ids_by_shard",
+    "sync_sites_to_shards",
+]
+
+
+def get_database_shards() -> dict[str | int, str]:
+    """Returns a dict of {country or site_id: database alias}.
+
+    For example:
+        EDC_SITES_DATABASE_SHARDS = {"botswana": "bw", "namibia": "na", 61: "na_61"}
+    """
+    return getattr(settings, "EDC_SITES_DATABASE_SHARDS", {})
+
+
+def get_shard_for_site(site_id: int | None) -> str:
+    """Returns the database alias for this site_id, first by site_id
+    then by the country of the registered site, else `default`.
+    """
+    from .site import SiteNotRegistered, sites  # prevent circular import
+
+    shards = get_database_shards()
+    if site_id in shards:
+        return shards[site_id]
+    try:
+        country = sites.get(site_id).country
+    except SiteNotRegistered:
+        return DEFAULT_DB_ALIAS
+    return shards.get(country, DEFAULT_DB_ALIAS)
+
+
+def get_site_ids_by_shard(site_ids: list[int] | None = None) -> dict[str, list[int]]:
+    """Returns a dict of {database alias: [site_id, ...]} for the
+    given or all registered site_ids.
+    """
+    from .site import sites  # prevent circular import
+
+    site_ids_by_shard = {}
+    for site_id in sorted(sites.all() if site_ids is None else site_ids):
+        site_ids_by_shard.setdefault(get_shard_for_site(site_id), []).append(site_id)
+    return site_ids_by_shard
+
+
+def fan_out(queryset: QuerySet, site_ids: list[int] | None = None) -> list[QuerySet]:
+    """Returns one queryset per database alias, each filtered on the
+    site_ids routed to that alias.
+
+    For example, for a user that may view other sites:
+
+        site_ids = sites.get_view_only_site_ids_for_user(request=request)
+        querysets = fan_out(SubjectVisit.objects.all(), [request.site.id] + site_ids)
+        total = sum(qs.count() for qs in querysets)
+    """
+    return [
+        queryset.using(alias).filter(site_id__in=shard_site_ids)
+        for alias, shard_site_ids in get_site_ids_by_shard(site_ids).items()
+    ]
+
+
+def copy_rows_to_shard(
+    model_cls: Type[Model], objs: list[Model], alias: str, update_fields: list[str]
+) -> None:
+    """Inserts or updates these rows by id in the database `alias`.
+
+    Uses one upsert if the backend supports a conflict target,
+    otherwise (e.g. MySQL) inserts the missing rows and updates the
+    changed rows in bulk.
+    """
+    queryset = model_cls._base_manager.using(alias)
+    if connections[alias].features.supports_update_conflicts_with_target:
+        queryset.bulk_create(
+            objs, update_conflicts=True, unique_fields=["id"], update_fields=update_fields
+        )
+    else:
+        existing = queryset.in_bulk([obj.id for obj in objs])
+        attnames = [model_cls._meta.get_field(name).attname for name in update_fields]
+        queryset.bulk_create([obj for obj in objs if obj.id not in existing])
+        changed = [
+            obj
+            for obj in objs
+            if obj.id in existing
+            and any(getattr(obj, a) != getattr(existing[obj.id], a) for a in attnames)
+        ]
+        if changed:
+            queryset.bulk_update(changed, update_fields)
+
+
+def sync_sites_to_shards(aliases: list[str] | None = None) -> None:
+    """Copies the Site and SiteProfile rows from the default database
+    to each shard.
+
+    Rows of a `SiteModelMixin` model have a foreign key to Site, so
+    every shard needs the Site table. Call after
+    `add_or_update_django_sites`.
+    """
+    from .models import SiteProfile  # prevent circular import
+
+    site_model_cls = get_site_model_cls()
+    aliases = aliases or sorted(set(get_database_shards().values()) - {DEFAULT_DB_ALIAS})
+    site_objs = list(site_model_cls.objects.using(DEFAULT_DB_ALIAS).all())
+    site_profiles = list(SiteProfile.objects.using(DEFAULT_DB_ALIAS).all())
+    for alias in aliases:
+        copy_rows_to_shard(site_model_cls, site_objs, alias, ["name", "domain"])
+        copy_rows_to_shard(
+            SiteProfile,
+            site_profiles,
+            alias,
+            ["site", "title", "country", "country_code", "languages"],
+        )
+    # bulk_create does not send post_save
+    site_identity_map.clear()
+
+
+def is_site_model(model: Type[Model]) -> bool:
+    from .model_mixins import SiteModelMixin  # prevent circular import
+
+    return issubclass(model, SiteModelMixin)
+
+
+class SiteShardRouter:
+    """A database router for models declared with `SiteModelMixin`.
+
+    Reads and writes are routed by the site of the instance or, if
+    there is no instance, by the current site (see `sites.use_site`)
+    using settings.EDC_SITES_DATABASE_SHARDS. Other models are not
+    routed.
+
+    Use `fan_out` to query more than one shard, e.g. for multisite
+    viewers.
+
+        DATABASE_ROUTERS = ["edc_sites.routers.SiteShardRouter"]
+    """
+
+    def db_for_read(self, model: Type[Model], **hints) -> str | None:
+        return self.db_for_site_model(model, **hints)
+
+    def db_for_write(self, model: Type[Model], **hints) -> str | None:
+        return self.db_for_site_model(model, **hints)
+
+    @staticmethod
+    def db_for_site_model(model: Type[Model], **hints) -> str | None:
+        if not is_site_model(model):
+            return None
+        site_id = getattr(hints.get("instance"), "site_id", None)
+        if site_id is None:
+            site_id = get_current_site_id()
+        return get_shard_for_site(site_id)
+
+    @staticmethod
+    def allow_relation(obj1: Model, obj2: Model, **hints) -> bool | None:
+        # Site rows are copied to every shard
+        if isinstance(obj1, get_site_model_cls()) or isinstance(obj2, get_site_model_cls()):
+            return True
+        return None
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import KW_ONLY, dataclass, field
 
+from ..startup_profiler import startup_profiler
 from .get_languages import get_languages
 
 
@@ -27,7 +28,8 @@ class SingleSite:
     description: str = field(init=False)
 
     def __post_init__(self):
-        self.languages = get_languages(self.language_codes, self.site_id)
+        with startup_profiler.phase("single_site.languages"):
+            self.languages = get_languages(self.language_codes, self.site_id)
         self.description = (self.title or self.name).title()
 
     def __str__(self):
@@ -2,32 +2,32 @@ from __future__ import annotations
 
 import dataclasses
 import sys
-from copy import deepcopy
-from typing import TYPE_CHECKING, Any
+from contextlib import contextmanager
+from copy import copy
+from importlib.util import find_spec
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Iterator
 
 from django.apps import apps as django_apps
 from django.conf import settings
-from django.contrib import messages
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.handlers.wsgi import WSGIRequest as BaseWSGIRequest
-from django.core.management.color import color_style
-from django.utils.module_loading import import_module, module_has_submodule
-from edc_auth.utils import user_has_change_perms
+from django.utils.module_loading import import_module
 from edc_constants.constants import OTHER
-from edc_model_admin.utils import add_to_messages_once
 
+from .current_site import get_current_site_obj, use_site
 from .exceptions import InvalidSiteForUser
+from .registry_snapshot import RegistrySnapshotError, read_registry_snapshot
 from .single_site import SingleSite
-from .utils import (
-    get_message_text,
-    get_site_model_cls,
-    has_profile_or_raise,
-    insert_into_domain,
-)
+from .site_cache import get_site_cache_key, invalidate_site_cache
+from .site_identity_map import site_identity_map
+from .startup_profiler import startup_profiler
+from .utils import get_site_model_cls, has_profile_or_raise, insert_into_domain
 
 if TYPE_CHECKING:
+    import pandas as pd
     from django.contrib.auth.models import User
     from django.contrib.sites.models import Site
+    from django.core.handlers.wsgi import WSGIRequest as BaseWSGIRequest
 
     class WSGIRequest(BaseWSGIRequest):
         site: Site
@@ -88,16 +88,28 @@ def get_autodiscover_sites():
     return getattr(settings, "EDC_SITES_AUTODISCOVER_SITES", True)
 
 
+def get_registry_snapshot() -> str | None:
+    return getattr(settings, "EDC_SITES_REGISTRY_SNAPSHOT", None)
+
+
 class Sites:
     uat_subdomain = "uat"
 
     def __init__(self):
         self.loaded = False
-        self._registry = {}
+        self.snapshot_path = None
+        self._registry: dict[int, SingleSite] = {}
+        # changed by `register`, `load_snapshot` and `initialize`. Use
+        # to invalidate values derived from the registry.
+        self.registry_version = 0
+        self._resolver = None
+        self._resolver_version = None
+        self._frame = None
+        self._frame_version = None
         if get_register_default_site():
             self.loaded = True
             site_id = int(settings.SITE_ID)
-            self._registry: dict[int, SingleSite] = {
+            self._registry = {
                 site_id: SingleSite(
                     site_id,
                     settings.APP_NAME,
@@ -122,13 +134,26 @@ class Sites:
         is called you will also have to initialize the Site model.
         """
         if initialize_site_model:
-            for obj in get_site_model_cls().objects.all():
-                try:
-                    obj.siteprofile.delete()
-                except ObjectDoesNotExist:
-                    break
-            get_site_model_cls().objects.all().delete()
+            self.reset_site_model()
+        else:
+            site_identity_map.clear()
+        registry_version = self.registry_version
         self.__init__()
+        self.registry_version = registry_version + 1
+
+    @staticmethod
+    def reset_site_model() -> None:
+        """Deletes all SiteProfile and Site rows, one delete per table.
+
+        Related rows cascade or protect as usual. The identity map and
+        the site cache are then cleared once.
+        """
+        from .models import SiteProfile  # prevent circular import
+
+        SiteProfile.objects.all().delete()
+        get_site_model_cls().objects.all().delete()
+        site_identity_map.clear()
+        invalidate_site_cache()
 
     def register(self, *single_sites: SingleSite):
         if not self.loaded:
@@ -151,6 +176,19 @@ class Sites:
                         f"Site with this domain is already registered. Got `{single_site}`."
                     )
                 self._registry.update({single_site.site_id: single_site})
+                self.registry_version += 1
+
+    def load_snapshot(self, path: str) -> None:
+        """Replaces the registry with the SingleSites read from a
+        registry snapshot file or raises RegistrySnapshotError.
+
+        See also: `sync_sites --write-snapshot`.
+        """
+        single_sites = read_registry_snapshot(path)
+        self._registry = {single_site.site_id: single_site for single_site in single_sites}
+        self.registry_version += 1
+        self.loaded = True
+        self.snapshot_path = path
 
     def get(self, site_id: int) -> SingleSite:
         """Returns a SingleSite instance for this site_id or
@@ -173,6 +211,52 @@ class Sites:
             )
         return self._registry.get(site_id)
 
+    def get_by_domain(self, host: str) -> SingleSite | None:
+        """Returns the SingleSite for this request host or None.
+
+        The host may include a port or the UAT subdomain. See also
+        SiteResolver and SiteRegistryMiddleware.
+        """
+        from .site_resolver import SiteResolver
+
+        if self._resolver is None or self._resolver_version != self.registry_version:
+            self._resolver = SiteResolver(self.all(aslist=True), self.uat_subdomain)
+            self._resolver_version = self.registry_version
+        return self._resolver.resolve(host)
+
+    @contextmanager
+    def use_site(self, site_id: int | Site) -> Iterator[SingleSite]:
+        """Context manager to override the current site for this
+        thread or asyncio task, e.g. in a batch job or celery task.
+
+        Raises SiteNotRegistered if the site is not registered.
+        See also: `edc_sites.current_site.use_site`.
+        """
+        single_site = self.get(int(getattr(site_id, "id", site_id)))
+        with use_site(single_site.site_id):
+            yield single_site
+
+    def cache_key(self, site_id: int | Site, *parts) -> str:
+        """Returns a cache key for a per-site value, e.g. a dashboard
+        fragment, namespaced on the site and its cache version.
+
+            key = sites.cache_key(request.site.id, "subject_dashboard", subject_identifier)
+
+        The version changes when the Site or SiteProfile of the site
+        is saved or deleted, when `sync_sites` changes the site, or on
+        `invalidate_cache`. Raises SiteNotRegistered if the site is
+        not registered.
+        """
+        single_site = self.get(int(getattr(site_id, "id", site_id)))
+        return get_site_cache_key(single_site.site_id, *parts)
+
+    @staticmethod
+    def invalidate_cache(*site_ids: int) -> None:
+        """Invalidates the keys from `cache_key` for the given
+        site_ids or, if none are given, for all sites.
+        """
+        invalidate_site_cache(*site_ids)
+
     def get_by_attr(self, attrname: str, value: Any) -> SingleSite:
         for single_site in self._registry.values():
             if getattr(single_site, attrname) == value:
@@ -188,6 +272,52 @@ class Sites:
     def countries(self) -> list[str]:
         return list(set([single_site.country for single_site in self._registry.values()]))
 
+    def to_frame(self) -> pd.DataFrame:
+        """Returns a pandas DataFrame of the registered sites indexed
+        on `site_id` with categorical columns.
+
+        Requires pandas.
+        """
+        return self._get_frame().copy()
+
+    def map_series(self, series: pd.Series, attrname: str) -> pd.Series:
+        """Maps a Series of site_ids to a categorical Series of the
+        SingleSite attribute, e.g. `country`, in one vectorized lookup.
+
+        Unregistered site_ids map to NaN. Requires pandas.
+        """
+        import numpy as np
+        import pandas as pd
+
+        frame = self._get_frame()
+        if attrname not in frame.columns:
+            raise SitesError(
+                f"Invalid attribute. Expected one of {list(frame.columns)}. Got `{attrname}`."
+            )
+        lookup = frame[attrname]
+        positions = frame.index.get_indexer(series)
+        found = positions != -1
+        codes = np.full(len(positions), -1, dtype=lookup.cat.codes.dtype)
+        codes[found] = lookup.cat.codes.to_numpy()[positions[found]]
+        return pd.Series(
+            pd.Categorical.from_codes(codes, dtype=lookup.dtype),
+            index=series.index,
+            name=attrname,
+        )
+
+    def _get_frame(self) -> pd.DataFrame:
+        import pandas as pd
+
+        if self._frame is None or self._frame_version != self.registry_version:
+            columns = ["name", "domain", "title", "description", "country", "country_code"]
+            single_sites = self.all(aslist=True)
+            self._frame = pd.DataFrame(
+                {attr: [getattr(s, attr) for s in single_sites] for attr in columns},
+                index=pd.Index([s.site_id for s in single_sites], name="site_id"),
+            ).astype("category")
+            self._frame_version = self.registry_version
+        return self._frame
+
     def get_by_country(
         self, country: str, aslist: bool | None = None
     ) -> dict[int, SingleSite] | list[SingleSite]:
@@ -232,16 +362,31 @@ class Sites:
         Checks for userprofile.is_multisite_viewer and
         confirms user does not have `add`, `change` or `delete`
         perms to any resources.
+
+        If `request` is given, the result is kept on the request. A
+        changelist asks for it several times and each call queries
+        the user's profile, roles and permissions.
         """
         if request:
             user = request.user
             site_id = request.site.id
+            cache_key = (user.pk, site_id)
+            cached = getattr(request, "view_only_site_ids", None)
+            if cached and cached[0] == cache_key:
+                return list(cached[1])
         site_id = sites.get(site_id).site_id
         has_profile_or_raise(user)
         sites.site_in_profile_or_raise(user=user, site_id=site_id)
         # now check for special view codename from user account
         site_ids = []
         if user.userprofile.is_multisite_viewer:
+            # imported on first use to keep the import of this module light
+            from django.contrib import messages
+            from edc_auth.utils import user_has_change_perms
+            from edc_model_admin.utils import add_to_messages_once
+
+            from .utils import get_message_text
+
             if user_has_change_perms(user=user):
                 if request:
                     add_to_messages_once(
@@ -262,8 +407,9 @@ class Sites:
         #             for s in request.user.userprofile.sites.all()
         #             if s.id != request.site.id
         #         ]
-
-        return site_ids
+        if request:
+            request.view_only_site_ids = (cache_key, site_ids)
+        return list(site_ids)
 
     def user_may_view_other_sites(
         self,
@@ -309,42 +455,72 @@ class Sites:
     def get_current_site_obj(request: WSGIRequest | None = None) -> Site:
         if request:
             return request.site
-        return get_site_model_cls().objects.get_current()
+        return get_current_site_obj()
 
     def get_current_site(self, request: WSGIRequest | None = None) -> SingleSite:
         if request:
             return self.get(request.site.id)
-        return self.get(get_site_model_cls().objects.get_current().id)
+        return self.get(get_current_site_obj().id)
 
     def get_current_country(self, request: WSGIRequest | None = None) -> str:
         single_site = self.get_current_site(request)
         return single_site.country
 
     @staticmethod
-    def autodiscover(module_name=None, verbose=True):
+    def autodiscover(module_name=None, verbose=True, use_snapshot=True):
         """Autodiscovers query rule classes in the sites.py file of
         any INSTALLED_APP.
+
+        Apps without a `sites` module are skipped using `find_spec`
+        so the registry is only copied before an actual import.
+
+        If `settings.EDC_SITES_REGISTRY_SNAPSHOT` is set, the registry
+        is loaded from the snapshot file instead, unless `use_snapshot`
+        is False. Falls back to autodiscovery if the snapshot is
+        invalid.
         """
+        from django.core.management.color import color_style
+
         module_name = module_name or "sites"
         writer = sys.stdout.write if verbose else lambda x: x
         style = color_style()
-        writer(f" * checking for {module_name} (edc_sites)...\n")
-        for app in django_apps.app_configs:
+        if use_snapshot and module_name == "sites" and (path := get_registry_snapshot()):
             try:
-                mod = import_module(app)
+                with startup_profiler.phase("load_snapshot"):
+                    sites.load_snapshot(path)
+            except RegistrySnapshotError as e:
+                writer(style.WARNING(f" * ignoring registry snapshot (edc_sites). {e}\n"))
+            else:
+                writer(
+                    f" * loaded {len(sites.all())} sites from snapshot {path} (edc_sites)\n"
+                )
+                return
+        writer(f" * checking for {module_name} (edc_sites)...\n")
+        with startup_profiler.phase("autodiscover"):
+            for app in django_apps.app_configs:
+                try:
+                    if not find_spec(f"{app}.{module_name}"):
+                        continue
+                except ImportError:
+                    continue
+                # SingleSite instances are not modified after registration,
+                # a shallow copy is enough to roll back a failed import.
+                before_import_registry = copy(sites._registry)
+                start = perf_counter()
                 try:
-                    before_import_registry = deepcopy(sites._registry)
                     import_module(f"{app}.{module_name}")
-                    writer(f"   - registered '{module_name}' from '{app}'\n")
                 except SitesError as e:
                     writer(f"   - loading {app}.{module_name} ... ")
                     writer(style.ERROR(f"ERROR! {e}\n"))
                 except ImportError as e:
                     sites._registry = before_import_registry
-                    if module_has_submodule(mod, module_name):
-                        raise SitesError(str(e))
-            except ImportError:
-                pass
+                    sites.registry_version += 1
+                    raise SitesError(str(e))
+                else:
+                    writer(
+                        f"   - registered '{module_name}' from '{app}' "
+                        f"({(perf_counter() - start) * 1000:.1f}ms)\n"
+                    )
 
 
 sites = Sites()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import time
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+__all__ = [
+    "get_site_cache_key",
+    "get_site_cache_version",
+    "invalidate_site_cache",
+]
+
+VERSION_KEY = "edc_sites.site_cache_version.{key}"
+
+
+def get_version_keys(site_id: int) -> tuple[str, str]:
+    return VERSION_KEY.format(key="all"), VERSION_KEY.format(key=site_id)
+
+
+def get_site_cache_version(site_id: int) -> str:
+    """Returns the cache version for this site_id as
+    "<version for all sites>.<version for this site>".
+
+    Versions are kept in the Django cache without a timeout. A
+    missing version, e.g. evicted, starts at the current time in ns so
+    that keys from before the eviction are not reused.
+    """
+    keys = get_version_keys(site_id)
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key)
+    return ".".join(str(versions[key]) for key in keys)
+
+
+def get_site_cache_key(site_id: int, *parts) -> str:
+    """Returns a cache key namespaced on this site_id and its current
+    cache version.
+    """
+    key = f"edc_sites.site.{site_id}.{get_site_cache_version(site_id)}"
+    return ".".join([key, *[str(part) for part in parts]])
+
+
+def invalidate_site_cache(*site_ids: int) -> None:
+    """Invalidates the cache keys for the given site_ids or, if none
+    are given, for all sites.
+
+    Increments a version counter per site, or one counter for all
+    sites. Cached values are not deleted but are no longer reachable
+    and expire by their own timeout.
+    """
+    keys = [VERSION_KEY.format(key=site_id) for site_id in site_ids] or [
+        VERSION_KEY.format(key="all")
+    ]
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), None)
+
+
+@receiver(post_save, sender="sites.Site", dispatch_uid="invalidate_site_cache_on_site_save")
+@receiver(
+    post_delete, sender="sites.Site", dispatch_uid="invalidate_site_cache_on_site_delete"
+)
+def invalidate_site_cache_on_site_change(sender, instance, **kwargs) -> None:
+    invalidate_site_cache(instance.pk)
+
+
+@receiver(
+    post_save,
+    sender="edc_sites.SiteProfile",
+    dispatch_uid="invalidate_site_cache_on_site_profile_save",
+)
+@receiver(
+    post_delete,
+    sender="edc_sites.SiteProfile",
+    dispatch_uid="invalidate_site_cache_on_site_profile_delete",
+)
+def invalidate_site_cache_on_site_profile_change(sender, instance, **kwargs) -> None:
+    invalidate_site_cache(instance.site_id)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .utils.get_site_model_cls import get_site_model_cls
+
+if TYPE_CHECKING:
+    from django.contrib.sites.models import Site
+
+__all__ = ["SiteIdentityMap", "get_site_identity_map_enabled", "site_identity_map"]
+
+
+def get_site_identity_map_enabled() -> bool:
+    return getattr(settings, "EDC_SITES_SITE_IDENTITY_MAP", True)
+
+
+class SiteIdentityMap:
+    """A process-wide map of {site_id: Site row} per database.
+
+    All Site rows are loaded in one query on first access. Each call
+    to `get` returns a new Site instance built from the row, so
+    callers do not share cached relations or changes.
+
+    The map is cleared when a Site or SiteProfile is saved or deleted
+    in this process. Like the SITE_CACHE of django.contrib.sites, it
+    is not cleared by changes made in other processes; call `clear`,
+    e.g. after `sync_sites`, or restart.
+    """
+
+    def __init__(self):
+        self._sites: dict[str, dict[int, tuple]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(loaded={list(self._sites)})"
+
+    def get(self, site_id: int | None, using: str | None = None) -> Site | None:
+        """Returns a Site instance for this site_id or None."""
+        if site_id is None:
+            return None
+        using = using or DEFAULT_DB_ALIAS
+        sites = self._sites.get(using)
+        if sites is None:
+            sites = self.load(using)
+        if (row := sites.get(site_id)) is None:
+            return None
+        model_cls = get_site_model_cls()
+        return model_cls.from_db(
+            using, [f.attname for f in model_cls._meta.concrete_fields], row
+        )
+
+    def load(self, using: str | None = None) -> dict[int, tuple]:
+        using = using or DEFAULT_DB_ALIAS
+        with self._lock:
+            if (sites := self._sites.get(using)) is None:
+                model_cls = get_site_model_cls()
+                field_names = [f.attname for f in model_cls._meta.concrete_fields]
+                pk_index = field_names.index(model_cls._meta.pk.attname)
+                sites = {
+                    row[pk_index]: row
+                    for row in model_cls.objects.using(using).values_list(*field_names)
+                }
+                self._sites[using] = sites
+        return sites
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sites = {}
+
+
+site_identity_map = SiteIdentityMap()
+
+
+@receiver(post_save, sender="sites.Site", dispatch_uid="clear_site_identity_map_on_save")
+@receiver(post_delete, sender="sites.Site", dispatch_uid="clear_site_identity_map_on_delete")
+@receiver(
+    post_save,
+    sender="edc_sites.SiteProfile",
+    dispatch_uid="clear_site_identity_map_on_site_profile_save",
+)
+@receiver(
+    post_delete,
+    sender="edc_sites.SiteProfile",
+    dispatch_uid="clear_site_identity_map_on_site_profile_delete",
+)
+def clear_site_identity_map(sender, **kwargs) -> None:
+    site_identity_map.clear()
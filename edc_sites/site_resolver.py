@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from django.http.request import split_domain_port
+
+from .single_site import SingleSite
+from .utils.insert_into_domain import get_uat_variant
+
+__all__ = ["SiteResolver"]
+
+
+class SiteResolver:
+    """Resolves a request host to a registered SingleSite with a
+    dictionary lookup.
+
+    Hosts are matched case-insensitive, without the port or a
+    trailing dot. The UAT (or live) variant of each registered
+    domain resolves to the same site. See `insert_into_domain`.
+    """
+
+    def __init__(self, single_sites: list[SingleSite], uat_subdomain: str | None = None):
+        self.domains: dict[str, SingleSite] = {}
+        for single_site in single_sites:
+            if not single_site.domain:
+                continue
+            domain, _ = split_domain_port(single_site.domain)
+            self.domains.update({domain: single_site})
+        if uat_subdomain:
+            for domain, single_site in list(self.domains.items()):
+                self.domains.setdefault(get_uat_variant(domain, uat_subdomain), single_site)
+
+    def resolve(self, host: str) -> SingleSite | None:
+        domain, _ = split_domain_port(host)
+        return self.domains.get(domain)
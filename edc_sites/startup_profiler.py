@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import sys
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+
+from django.conf import settings
+from django.db import connections
+
+__all__ = ["PhaseStats", "StartupProfiler", "get_profile_startup", "startup_profiler"]
+
+logger = logging.getLogger(__name__)
+
+
+def get_profile_startup() -> bool:
+    """Returns True if edc_sites startup phases should be profiled.
+
+    Set `settings.EDC_SITES_PROFILE_STARTUP=True` or the environment
+    variable `EDC_SITES_PROFILE_STARTUP=1`.
+    """
+    if os.environ.get("EDC_SITES_PROFILE_STARTUP", "").lower() in ["1", "true", "yes"]:
+        return True
+    return getattr(settings, "EDC_SITES_PROFILE_STARTUP", False)
+
+
+@dataclass
+class PhaseStats:
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    queries: int = 0
+
+    def __str__(self):
+        return (
+            f"{self.name}: {self.seconds * 1000:.1f}ms, "
+            f"{self.queries} queries, {self.calls} call(s)"
+        )
+
+
+class StartupProfiler:
+    """Records wall time and query counts per edc_sites startup phase.
+
+    Phases are accumulated by name, e.g. the language resolution in
+    every `SingleSite.__post_init__` is reported as one phase.
+
+    Does nothing unless `get_profile_startup` returns True or
+    `force_enabled` is set. The summary is reported to stderr at exit
+    unless `report_at_exit` is False.
+    """
+
+    def __init__(self, force_enabled: bool | None = None, report_at_exit: bool | None = None):
+        self.phases: dict[str, PhaseStats] = {}
+        self.force_enabled = force_enabled
+        self._atexit_registered = report_at_exit is False
+
+    @property
+    def enabled(self) -> bool:
+        return self.force_enabled or get_profile_startup()
+
+    def reset(self) -> None:
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        stats = self.phases.setdefault(name, PhaseStats(name=name))
+        counter = [0]
+
+        def count_queries(execute, sql, params, many, context):
+            counter[0] += 1
+            return execute(sql, params, many, context)
+
+        start = perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(count_queries))
+                yield
+        finally:
+            stats.calls += 1
+            stats.seconds += perf_counter() - start
+            stats.queries += counter[0]
+            logger.debug(f"edc_sites phase {stats}")
+            if not self._atexit_registered:
+                # stderr, so that command output on stdout stays parseable
+                atexit.register(self.report, sys.stderr.write)
+                self._atexit_registered = True
+
+    def summary(self) -> str:
+        lines = [" edc_sites startup profile:"]
+        for stats in self.phases.values():
+            lines.append(f"   - {stats}")
+        return "\n".join(lines)
+
+    def report(self, writer=None) -> None:
+        if self.phases:
+            summary = self.summary()
+            logger.info(summary)
+            (writer or sys.stdout.write)(f"{summary}\n")
+
+
+startup_profiler = StartupProfiler()
@@ -7,6 +7,7 @@ from django.db import OperationalError
 from edc_sites.single_site import SingleSite
 from edc_sites.site import SitesCheckError
 from edc_sites.site import sites as site_sites
+from edc_sites.startup_profiler import startup_profiler
 from edc_sites.utils import get_site_model_cls
 
 
@@ -14,7 +15,8 @@ def sites_check(app_configs, **kwargs):  # noqa
     errors = []
     if "migrate" not in sys.argv and "makemigrations" not in sys.argv:
         try:
-            compare_single_sites_with_db()
+            with startup_profiler.phase("sites_check"):
+                compare_single_sites_with_db()
         except (SitesCheckError, OperationalError) as e:
             errors.append(
                 Error(
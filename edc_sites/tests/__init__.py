@@ -1 +1,18 @@
+from importlib import import_module
+
 from .site_test_case_mixin import SiteTestCaseMixin  # noqa
+
+# imported on first access, the test settings module is in this
+# package and is imported before the app registry is ready.
+lazy_imports = {
+    "MULTISITE_VIEWER": "site_query_budget_test_case_mixin",
+    "SINGLE_SITE": "site_query_budget_test_case_mixin",
+    "VIEWALLSITES": "site_query_budget_test_case_mixin",
+    "SiteQueryBudgetTestCaseMixin": "site_query_budget_test_case_mixin",
+}
+
+
+def __getattr__(name: str):
+    if module_name := lazy_imports.get(name):
+        return getattr(import_module(f"{__name__}.{module_name}"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
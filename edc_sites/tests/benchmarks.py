@@ -0,0 +1,197 @@
+"""Benchmarks for the edc_sites hot paths.
+
+Run from the repo root with the test settings and SQLite:
+
+    python runbenchmarks.py [--repeat 20]
+
+Each benchmark reports the mean and best wall time over `repeat`
+calls and the number of queries per call.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+from copy import copy
+from importlib.util import find_spec
+from statistics import mean
+from time import perf_counter
+from typing import Callable
+
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.db import connection
+from django.test import Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from edc_sites.admin.list_filters import SiteListFilter
+from edc_sites.single_site import SingleSite
+from edc_sites.site import Sites, sites
+from edc_sites.system_checks import compare_single_sites_with_db
+from edc_sites.utils import add_or_update_django_sites
+
+from .models import TestModelWithSite
+from .sites import sites as default_sites
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    name: str
+    times: list[float]
+    queries: int
+
+    def __str__(self):
+        return (
+            f"{self.name:<50} {mean(self.times) * 1000:>10.3f} "
+            f"{min(self.times) * 1000:>10.3f} {self.queries:>8}"
+        )
+
+
+def run_benchmark(name: str, func: Callable, repeat: int) -> BenchmarkResult:
+    """Calls `func` once to warm up then `repeat` times."""
+    func()
+    times = []
+    with CaptureQueriesContext(connection) as context:
+        for _ in range(repeat):
+            start = perf_counter()
+            func()
+            times.append(perf_counter() - start)
+    return BenchmarkResult(name=name, times=times, queries=len(context) // repeat)
+
+
+def single_sites_factory(count: int) -> list[SingleSite]:
+    return [
+        SingleSite(
+            site_id,
+            f"site{site_id}",
+            title=f"Site {site_id}",
+            country="botswana",
+            country_code="bw",
+            language_codes=["en"],
+            domain=f"site{site_id}.bw.clinicedc.org",
+        )
+        for site_id in range(100, 100 + count)
+    ]
+
+
+def register_benchmarks(repeat: int) -> list[BenchmarkResult]:
+    results = []
+    for count in [10, 100, 1000]:
+        single_sites = single_sites_factory(count)
+
+        def register():
+            Sites().register(*single_sites)
+
+        results.append(run_benchmark(f"Sites.register ({count} sites)", register, repeat))
+    registry = Sites()
+    registry.register(*single_sites_factory(1000))
+    results.append(
+        run_benchmark(
+            "Sites.get_by_attr (1000 sites, last name)",
+            lambda: registry.get_by_attr("name", "site1099"),
+            repeat,
+        )
+    )
+    return results
+
+
+def request_factory(user: User, site_id: int):
+    request = RequestFactory().get("/")
+    request.user = user
+    request.site = Site.objects.get(id=site_id)
+    return request
+
+
+def db_benchmarks(repeat: int) -> list[BenchmarkResult]:
+    results = []
+    sites.initialize()
+    sites.register(*default_sites)
+    results.append(
+        run_benchmark(
+            "add_or_update_django_sites",
+            lambda: add_or_update_django_sites(verbose=False),
+            repeat,
+        )
+    )
+    results.append(
+        run_benchmark("compare_single_sites_with_db", compare_single_sites_with_db, repeat)
+    )
+
+    site_ids = [s.site_id for s in default_sites]
+    user = User.objects.create_user("viewer", "viewer@example.com", "pass")  # nosec B106
+    user.userprofile.sites.add(*Site.objects.filter(id__in=site_ids))
+    user.userprofile.is_multisite_viewer = True
+    user.userprofile.save()
+    request = request_factory(user, site_ids[0])
+    results.append(
+        run_benchmark(
+            "get_view_only_site_ids_for_user",
+            lambda: sites.get_view_only_site_ids_for_user(user=user, site_id=site_ids[0]),
+            repeat,
+        )
+    )
+
+    model_admin = admin.site._registry[TestModelWithSite]
+    results.append(
+        run_benchmark(
+            "SiteListFilter.lookups",
+            # a copy, the view only site_ids are kept on the request
+            lambda: SiteListFilter(copy(request), {}, TestModelWithSite, model_admin),
+            repeat,
+        )
+    )
+
+    for site_id in site_ids:
+        TestModelWithSite.objects.bulk_create(
+            [TestModelWithSite(site_id=site_id) for _ in range(20)]
+        )
+    superuser = User.objects.create_superuser("admin", "admin@example.com", "pass")
+    superuser.userprofile.sites.add(*Site.objects.filter(id__in=site_ids))
+    client = Client()
+    client.force_login(superuser)
+    url = reverse(
+        f"admin:{TestModelWithSite._meta.app_label}_"
+        f"{TestModelWithSite._meta.model_name}_changelist"
+    )
+    # do not time a redirect or error page
+    response = client.get(url)
+    assert response.status_code == 200, response.status_code  # nosec B101
+    results.append(
+        run_benchmark("SiteModelAdminMixin changelist", lambda: client.get(url), repeat)
+    )
+    return results
+
+
+def pandas_benchmarks(repeat: int, rows: int = 3_000_000) -> list[BenchmarkResult]:
+    """Maps a column of site_ids to country, vectorized and row by
+    row. Skipped if pandas is not installed.
+    """
+    if not find_spec("pandas"):
+        return []
+    import numpy as np
+    import pandas as pd
+
+    sites.initialize()
+    sites.register(*default_sites)
+    site_ids = pd.Series(np.random.choice(list(sites.all()), rows))
+    return [
+        run_benchmark(
+            f"sites.map_series ({rows} rows)",
+            lambda: sites.map_series(site_ids, "country"),
+            repeat,
+        ),
+        run_benchmark(
+            f"Series.map(sites.get) ({rows} rows)",
+            lambda: site_ids.map(lambda site_id: sites.get(site_id).country),
+            max(1, repeat // 10),
+        ),
+    ]
+
+
+def main(repeat: int = 20) -> None:
+    results = register_benchmarks(repeat) + db_benchmarks(repeat) + pandas_benchmarks(repeat)
+    sys.stdout.write(f"\n{'benchmark':<50} {'mean ms':>10} {'best ms':>10} {'queries':>8}\n")
+    for result in results:
+        sys.stdout.write(f"{result}\n")
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Type
+
+from django.contrib import admin
+from django.contrib.auth import get_permission_codename, get_user_model
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
+from django.db import connection
+from django.test import Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from edc_sites.admin.list_filters import SiteListFilter
+from edc_sites.site import sites
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import User
+    from django.db.models import Model
+    from django.views import View
+
+SINGLE_SITE = "single_site"
+MULTISITE_VIEWER = "multisite_viewer"
+VIEWALLSITES = "viewallsites"
+
+__all__ = [
+    "MULTISITE_VIEWER",
+    "SINGLE_SITE",
+    "SiteQueryBudgetTestCaseMixin",
+    "VIEWALLSITES",
+]
+
+
+class SiteQueryBudgetTestCaseMixin:
+    """A TestCase mixin to assert upper bounds on the number of
+    queries for site-aware admin and views.
+
+    User types:
+        * SINGLE_SITE: view permissions for the current site only.
+        * MULTISITE_VIEWER: `userprofile.is_multisite_viewer` with all
+          registered sites in the user profile.
+        * VIEWALLSITES: the model specific `viewallsites` codename with
+          all registered sites in the user profile.
+
+    For example:
+
+        @override_settings(SITE_ID=10)
+        class TestQueryBudgets(SiteQueryBudgetTestCaseMixin, TestCase):
+            def test_changelist(self):
+                for user_type, max_queries in [(SINGLE_SITE, 12), (VIEWALLSITES, 14)]:
+                    with self.subTest(user_type=user_type):
+                        self.assertChangelistQueries(MyModel, max_queries, user_type)
+    """
+
+    query_budget_password = "pass"  # nosec B105
+    query_budget_admin_site = admin.site
+
+    def assertMaxQueries(self, max_queries: int, func, *args, **kwargs):  # noqa
+        with CaptureQueriesContext(connection) as context:
+            result = func(*args, **kwargs)
+        if len(context) > max_queries:
+            queries = "\n".join(
+                f"{i}. {query['sql']}" for i, query in enumerate(context.captured_queries, 1)
+            )
+            self.fail(
+                f"Query budget exceeded. Expected at most {max_queries} queries. "
+                f"Got {len(context)}.\n{queries}"
+            )
+        return result
+
+    def get_query_budget_user(self, user_type: str, model_cls: Type[Model]) -> User:
+        """Returns a staff user with view permissions on `model_cls`
+        for the given user type.
+        """
+        username = f"{user_type}_{model_cls._meta.label_lower.replace('.', '_')}"
+        if user := get_user_model().objects.filter(username=username).first():
+            return user
+        user = get_user_model().objects.create_user(
+            username, f"{username}@example.com", self.query_budget_password, is_staff=True
+        )
+        content_type = ContentType.objects.get_for_model(model_cls)
+        user.user_permissions.add(
+            Permission.objects.get(
+                content_type=content_type,
+                codename=get_permission_codename("view", model_cls._meta),
+            )
+        )
+        if user_type == SINGLE_SITE:
+            site_ids = [Site.objects.get_current().id]
+        else:
+            site_ids = list(sites.all())
+        user.userprofile.sites.add(*Site.objects.filter(id__in=site_ids))
+        if user_type == MULTISITE_VIEWER:
+            user.userprofile.is_multisite_viewer = True
+            user.userprofile.save()
+        elif user_type == VIEWALLSITES:
+            codename = get_permission_codename("viewallsites", model_cls._meta)
+            permission, _ = Permission.objects.get_or_create(
+                content_type=content_type,
+                codename=codename,
+                defaults=dict(name=f"Can view all sites {model_cls._meta.verbose_name}"),
+            )
+            user.user_permissions.add(permission)
+        return get_user_model().objects.get(id=user.id)
+
+    def get_query_budget_request(self, user: User, path: str = "/"):
+        request = RequestFactory().get(path)
+        request.user = user
+        request.site = Site.objects.get_current()
+        return request
+
+    def get_query_budget_client(self, user_type: str, model_cls: Type[Model]) -> Client:
+        client = Client()
+        client.force_login(self.get_query_budget_user(user_type, model_cls))
+        return client
+
+    def assertChangelistQueries(  # noqa
+        self, model_cls: Type[Model], max_queries: int, user_type: str
+    ):
+        client = self.get_query_budget_client(user_type, model_cls)
+        url = reverse(
+            f"{self.query_budget_admin_site.name}:"
+            f"{model_cls._meta.app_label}_{model_cls._meta.model_name}_changelist"
+        )
+        response = self.assertMaxQueries(max_queries, client.get, url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def assertChangeformQueries(self, obj: Model, max_queries: int, user_type: str):  # noqa
+        client = self.get_query_budget_client(user_type, obj.__class__)
+        url = reverse(
+            f"{self.query_budget_admin_site.name}:"
+            f"{obj._meta.app_label}_{obj._meta.model_name}_change",
+            args=(obj.pk,),
+        )
+        response = self.assertMaxQueries(max_queries, client.get, url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def assertSiteViewQueries(  # noqa
+        self,
+        view_cls: Type[View],
+        max_queries: int,
+        user_type: str,
+        model_cls: Type[Model],
+        **view_kwargs,
+    ):
+        """Asserts the query budget for a view declared with
+        `SiteViewMixin`. `model_cls` is used for the user's view
+        permissions.
+        """
+        request = self.get_query_budget_request(
+            self.get_query_budget_user(user_type, model_cls)
+        )
+
+        def get_response():
+            response = view_cls.as_view()(request, **view_kwargs)
+            if hasattr(response, "render"):
+                response.render()
+            return response
+
+        return self.assertMaxQueries(max_queries, get_response)
+
+    def assertSiteListFilterQueries(  # noqa
+        self, model_cls: Type[Model], max_queries: int, user_type: str
+    ):
+        request = self.get_query_budget_request(
+            self.get_query_budget_user(user_type, model_cls)
+        )
+        model_admin = self.query_budget_admin_site._registry[model_cls]
+        list_filter = self.assertMaxQueries(
+            max_queries, SiteListFilter, request, {}, model_cls, model_admin
+        )
+        return list_filter.lookup_choices
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from edc_sites.single_site import SingleSite
 
 from .sites import sites
@@ -8,6 +10,29 @@ class SiteTestCaseMixin:
     def get_default_sites(cls) -> list[SingleSite]:
         return sites
 
+    @classmethod
+    def add_sites_test_data(cls, single_sites: list[SingleSite] | None = None) -> None:
+        """Registers the default sites and adds or updates the Site
+        and SiteProfile rows.
+
+        Call from `setUpTestData`. If the tables already match the
+        registry, e.g. rows added by the post_migrate signal when the
+        test database was created, nothing is written. Otherwise only
+        the changed rows are saved with `apply_sites_diff`, so
+        `post_save` receivers (e.g. multisite aliases) run. Existing
+        rows are not deleted, so rows with a foreign key to Site are
+        not affected.
+        """
+        # imported here, this module is imported with the test settings
+        from edc_sites.site import sites as site_sites
+        from edc_sites.utils import apply_sites_diff, get_sites_diff
+
+        site_sites.initialize()
+        site_sites.register(*(single_sites or cls.get_default_sites()))
+        diff = get_sites_diff()
+        if diff.has_changes:
+            apply_sites_diff(diff)
+
     @property
     def default_sites(self) -> list[SingleSite]:
         return sites
@@ -0,0 +1,58 @@
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.single_site import SingleSite
+from edc_sites.site import sites
+from edc_sites.utils import get_allowed_hosts
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False)
+class TestAllowedHosts(SiteTestCaseMixin, TestCase):
+    def setUp(self):
+        sites.initialize()
+        sites.register(*self.default_sites)
+
+    def test_not_compacted(self):
+        allowed_hosts = get_allowed_hosts()
+        self.assertEqual(allowed_hosts.hosts, sorted(s.domain for s in self.default_sites))
+        self.assertEqual(allowed_hosts.ratio, 1.0)
+
+    def test_empty_single_sites(self):
+        allowed_hosts = get_allowed_hosts(single_sites=[], compact=True)
+        self.assertEqual(allowed_hosts.hosts, [])
+        self.assertEqual(allowed_hosts.domains, [])
+
+    def test_compacted(self):
+        allowed_hosts = get_allowed_hosts(compact=True)
+        self.assertEqual(allowed_hosts.hosts, [".bw.clinicedc.org"])
+        self.assertEqual(len(allowed_hosts.domains), 6)
+
+    def test_compacted_with_uat(self):
+        allowed_hosts = get_allowed_hosts(compact=True, include_uat=True)
+        self.assertEqual(allowed_hosts.hosts, [".bw.clinicedc.org"])
+        self.assertEqual(len(allowed_hosts.domains), 12)
+
+    def test_does_not_collapse_short_parent(self):
+        single_sites = [
+            SingleSite(1, "site1", domain="site1.clinicedc.org"),
+            SingleSite(2, "site2", domain="site2.clinicedc.org"),
+            SingleSite(3, "site3", domain="site3.tz.clinicedc.org"),
+        ]
+        allowed_hosts = get_allowed_hosts(single_sites, compact=True)
+        self.assertEqual(
+            allowed_hosts.hosts,
+            ["site1.clinicedc.org", "site2.clinicedc.org", "site3.tz.clinicedc.org"],
+        )
+
+    def test_wildcard_covered_by_shorter_wildcard(self):
+        single_sites = [
+            SingleSite(1, "site1", domain="site1.tz.clinicedc.org"),
+            SingleSite(2, "site2", domain="site2.tz.clinicedc.org"),
+            SingleSite(3, "site3", domain="site3.dar.tz.clinicedc.org"),
+            SingleSite(4, "site4", domain="site4.dar.tz.clinicedc.org"),
+            SingleSite(5, "site5", domain="site5.ug.clinicedc.org:8000"),
+        ]
+        allowed_hosts = get_allowed_hosts(single_sites, compact=True)
+        self.assertEqual(allowed_hosts.hosts, [".tz.clinicedc.org", "site5.ug.clinicedc.org"])
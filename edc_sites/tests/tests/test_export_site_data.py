@@ -0,0 +1,96 @@
+import csv
+import json
+import shutil
+from tempfile import mkdtemp
+
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.site import sites
+from edc_sites.utils import export_site_data
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False, SITE_ID=10)
+class TestExportSiteData(SiteTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.add_sites_test_data()
+
+    def setUp(self):
+        sites.initialize()
+        sites.register(*self.default_sites)
+        for site_id in [10, 20, 60]:
+            with sites.use_site(site_id):
+                for _ in range(3):
+                    TestModelWithSite.objects.create(f1=str(site_id))
+        self.path = mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_export_per_site_csv(self):
+        exported_files = export_site_data(TestModelWithSite, self.path, chunk_size=2)
+        self.assertEqual(
+            [f.partition for f in exported_files],
+            ["10", "20", "30", "40", "50", "60", "unregistered"],
+        )
+        self.assertEqual([f.rows for f in exported_files], [3, 3, 0, 0, 0, 3, 0])
+        with exported_files[1].path.open() as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(exported_files[1].path.name, "tests_testmodelwithsite_20.csv")
+        self.assertEqual(len(rows), 3)
+        self.assertEqual({row["site_id"] for row in rows}, {"20"})
+
+    def test_export_per_country_jsonl(self):
+        exported_files = export_site_data(
+            TestModelWithSite,
+            self.path,
+            fmt="jsonl",
+            partition="country",
+            fieldnames=["id", "site_id", "f1"],
+        )
+        self.assertEqual(
+            [f.partition for f in exported_files], ["botswana", "namibia", "unregistered"]
+        )
+        self.assertEqual(exported_files[0].site_ids, [10, 20, 30, 40, 50])
+        self.assertEqual([f.rows for f in exported_files], [6, 3, 0])
+        with exported_files[1].path.open() as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual([row["site_id"] for row in rows], [60, 60, 60])
+        self.assertEqual(rows[0]["f1"], "60")
+
+    def test_export_site_ids(self):
+        exported_files = export_site_data(TestModelWithSite, self.path, site_ids=[60])
+        self.assertEqual([(f.partition, f.rows) for f in exported_files], [("60", 3)])
+
+    def test_export_streams_one_query_per_partition(self):
+        with self.assertNumQueries(3):
+            export_site_data(TestModelWithSite, self.path, partition="country")
+
+    def test_export_unregistered_and_null_site_rows(self):
+        Site.objects.create(id=99, name="old", domain="old.clinicedc.org")
+        objs = TestModelWithSite.objects.filter(site_id=60).order_by("pk")
+        TestModelWithSite.objects.filter(pk=objs[0].pk).update(site_id=None)
+        TestModelWithSite.objects.filter(pk=objs[1].pk).update(site_id=99)
+        exported_files = export_site_data(TestModelWithSite, self.path, partition="country")
+        self.assertEqual([f.rows for f in exported_files], [6, 1, 2])
+        with exported_files[2].path.open() as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(
+            exported_files[2].path.name, "tests_testmodelwithsite_unregistered.csv"
+        )
+        self.assertEqual([row["site_id"] for row in rows], ["", "99"])
+        exported_files = export_site_data(TestModelWithSite, self.path, site_ids=[60])
+        self.assertEqual([(f.partition, f.rows) for f in exported_files], [("60", 1)])
+
+    def test_invalid_options(self):
+        self.assertRaises(
+            ValueError, export_site_data, TestModelWithSite, self.path, fmt="xml"
+        )
+        self.assertRaises(
+            ValueError, export_site_data, TestModelWithSite, self.path, partition="region"
+        )
@@ -0,0 +1,74 @@
+import dataclasses
+
+from django.apps import apps as django_apps
+from django.contrib.sites.models import Site
+from django.db.models.signals import post_save
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.models import SiteProfile
+from edc_sites.site import sites
+from edc_sites.utils import (
+    add_or_update_django_sites,
+    get_or_create_site_obj,
+    get_or_create_site_profile_obj,
+)
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False)
+class TestGetOrCreateSiteObj(SiteTestCaseMixin, TestCase):
+    def setUp(self):
+        sites.initialize(initialize_site_model=True)
+        sites.register(*self.default_sites)
+        self.saved = []
+        post_save.connect(self.on_post_save, sender=Site)
+        post_save.connect(self.on_post_save, sender=SiteProfile)
+
+    def tearDown(self):
+        post_save.disconnect(self.on_post_save, sender=Site)
+        post_save.disconnect(self.on_post_save, sender=SiteProfile)
+        super().tearDown()
+
+    def on_post_save(self, sender, instance, update_fields=None, **kwargs):
+        self.saved.append((sender._meta.model_name, instance.pk, update_fields))
+
+    def test_created(self):
+        site_obj, changed = get_or_create_site_obj(sites.get(10), django_apps)
+        self.assertTrue(changed)
+        site_profile, changed = get_or_create_site_profile_obj(
+            sites.get(10), site_obj, django_apps
+        )
+        self.assertTrue(changed)
+        self.assertEqual(site_profile.title, "Mochudi")
+
+    def test_unchanged_not_saved(self):
+        add_or_update_django_sites(verbose=False)
+        self.saved = []
+        site_obj, changed = get_or_create_site_obj(sites.get(10), django_apps)
+        self.assertFalse(changed)
+        _, changed = get_or_create_site_profile_obj(sites.get(10), site_obj, django_apps)
+        self.assertFalse(changed)
+        add_or_update_django_sites(verbose=False)
+        self.assertEqual(self.saved, [])
+
+    def test_saves_changed_fields_only(self):
+        add_or_update_django_sites(verbose=False)
+        self.saved = []
+        single_site = dataclasses.replace(
+            sites.get(20), domain="molepolole.na.clinicedc.org", title="New Title"
+        )
+        site_obj, changed = get_or_create_site_obj(single_site, django_apps)
+        self.assertTrue(changed)
+        _, changed = get_or_create_site_profile_obj(single_site, site_obj, django_apps)
+        self.assertTrue(changed)
+        self.assertEqual(
+            self.saved,
+            [
+                ("site", 20, frozenset({"domain"})),
+                ("siteprofile", site_obj.siteprofile.pk, frozenset({"title"})),
+            ],
+        )
+        self.assertEqual(Site.objects.get(id=20).domain, "molepolole.na.clinicedc.org")
+        self.assertEqual(SiteProfile.objects.get(site_id=20).title, "New Title")
@@ -0,0 +1,79 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+# settings are configured here, the test settings module is in the
+# edc_sites package and would import edc_sites first.
+SCRIPT = """
+import sys
+
+from django.conf import settings
+
+settings.configure(
+    INSTALLED_APPS=[
+        "django.contrib.auth",
+        "django.contrib.contenttypes",
+        "django.contrib.sites",
+        "edc_sites.apps.AppConfig",
+    ],
+    EDC_SITES_MODULE_NAME="edc_sites.tests.sites",
+)
+import django.db.models
+
+before = set(sys.modules)
+import edc_sites.site
+
+print(",".join(sorted(set(sys.modules) - before)))
+"""
+
+
+class TestImportTime(TestCase):
+    """Imports `edc_sites.site` in a fresh interpreter after settings
+    are configured and `django.db.models` is imported.
+    """
+
+    lazy_modules = [
+        "django.contrib.messages",
+        "django.core.handlers.wsgi",
+        "edc_auth.utils",
+        "edc_model_admin.utils",
+        "edc_registration",
+        "edc_sites.utils.site_data_export",
+        "edc_sites.utils.site_row_counts",
+        "edc_sites.utils.host_resolution",
+        "edc_sites.utils.site_runner",
+        "edc_sites.utils.multisite_aliases",
+        "concurrent.futures",
+        "socket",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        result = subprocess.run(
+            [sys.executable, "-c", SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        cls.imported = result.stdout.strip().split(",")
+
+    def test_rarely_used_dependencies_not_imported(self):
+        self.assertIn("edc_sites.site", self.imported)
+        for name in self.lazy_modules:
+            with self.subTest(name=name):
+                self.assertNotIn(name, self.imported)
+
+    def test_lazy_utils_not_shadowed_by_submodule(self):
+        script = (
+            "import edc_sites.utils.site_runner\n"
+            "from edc_sites.utils import run_for_sites\n"
+            "print(callable(run_for_sites))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", SCRIPT.split("before =")[0] + script],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "True")
@@ -0,0 +1,67 @@
+import dataclasses
+
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
+
+from edc_sites.middleware import SiteRegistryMiddleware
+from edc_sites.site import sites
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False, ALLOWED_HOSTS=["*"], SITE_ID=10)
+class TestSiteRegistryMiddleware(SiteTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.add_sites_test_data()
+
+    def setUp(self):
+        sites.initialize()
+        sites.register(*self.default_sites)
+        self.middleware = SiteRegistryMiddleware(lambda request: HttpResponse())
+
+    def test_get_by_domain(self):
+        self.assertEqual(sites.get_by_domain("mochudi.bw.clinicedc.org").site_id, 10)
+        self.assertEqual(sites.get_by_domain("MOCHUDI.bw.clinicedc.org:8000").site_id, 10)
+        self.assertEqual(sites.get_by_domain("mochudi.uat.bw.clinicedc.org").site_id, 10)
+        self.assertIsNone(sites.get_by_domain("unknown.clinicedc.org"))
+
+    def test_request_site_without_queries(self):
+        request = RequestFactory().get("/", HTTP_HOST="gaborone.bw.clinicedc.org:8000")
+        with self.assertNumQueries(0):
+            self.middleware(request)
+        self.assertEqual(request.site.id, 40)
+        self.assertEqual(request.site.name, "gaborone")
+        self.assertEqual(request.site.siteprofile.title, "Gaborone")
+
+    def test_unknown_host_falls_back_to_db(self):
+        request = RequestFactory().get("/", HTTP_HOST="unknown.clinicedc.org")
+        self.middleware(request)
+        self.assertEqual(request.site.id, 10)
+
+    def test_registry_change_refreshes_resolver(self):
+        self.assertIsNotNone(sites.get_by_domain("mochudi.bw.clinicedc.org"))
+        sites.initialize()
+        self.assertIsNone(sites.get_by_domain("mochudi.bw.clinicedc.org"))
+
+    def test_reregister_same_number_of_sites_refreshes_resolver(self):
+        # a new registry dict may reuse the address of the old one
+        for i in range(20):
+            sites.initialize()
+            sites.register(
+                *[
+                    dataclasses.replace(s, domain=f"{s.name}.site{i}.clinicedc.org")
+                    for s in self.default_sites
+                ]
+            )
+            self.assertEqual(sites.get_by_domain(f"mochudi.site{i}.clinicedc.org").site_id, 10)
+            self.assertIsNone(sites.get_by_domain("mochudi.bw.clinicedc.org"))
+
+    def test_registry_version(self):
+        version = sites.registry_version
+        sites.initialize()
+        self.assertGreater(sites.registry_version, version)
+        version = sites.registry_version
+        sites.register(*self.default_sites)
+        self.assertGreater(sites.registry_version, version)
@@ -0,0 +1,83 @@
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest.mock import patch
+
+from django.apps import apps as django_apps
+from django.test import TestCase
+
+from edc_sites.post_migrate_signals import migrate_call, post_migrate_update_sites
+from edc_sites.site import sites
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+class TestPostMigrateUpdateSites(SiteTestCaseMixin, TestCase):
+    def setUp(self):
+        sites.initialize()
+        sites.register(*self.default_sites)
+        migrate_call.__init__()
+
+    def tearDown(self):
+        migrate_call.__init__()
+        super().tearDown()
+
+    @staticmethod
+    def get_app_configs():
+        return [
+            app_config
+            for app_config in django_apps.get_app_configs()
+            if app_config.models_module is not None
+        ]
+
+    @patch("edc_sites.utils.add_or_update_django_sites")
+    def test_updates_once_per_migrate(self, mock_add_or_update):
+        apps, plan = object(), []
+        with redirect_stdout(StringIO()):
+            for app_config in self.get_app_configs():
+                post_migrate_update_sites(sender=app_config, apps=apps, plan=plan)
+        mock_add_or_update.assert_called_once()
+        self.assertEqual(migrate_call.skipped, len(self.get_app_configs()) - 1)
+
+    @patch("edc_sites.utils.add_or_update_django_sites")
+    def test_skips_logged_once_per_migrate(self, mock_add_or_update):
+        apps, plan = object(), []
+        with (
+            redirect_stdout(StringIO()),
+            self.assertLogs("edc_sites.post_migrate_signals", level="DEBUG") as cm,
+        ):
+            for app_config in self.get_app_configs():
+                post_migrate_update_sites(sender=app_config, apps=apps, plan=plan)
+        self.assertEqual(len(cm.output), 1)
+
+    @patch("edc_sites.utils.add_or_update_django_sites")
+    def test_updates_once_per_migrate_with_sender_filter(self, mock_add_or_update):
+        """Assert sites are updated if only some senders reach the
+        receiver, e.g. connected with a `sender` filter.
+        """
+        apps, plan = object(), []
+        with redirect_stdout(StringIO()):
+            post_migrate_update_sites(sender=self.get_app_configs()[0], apps=apps, plan=plan)
+        mock_add_or_update.assert_called_once()
+
+    @patch("edc_sites.utils.add_or_update_django_sites")
+    def test_updates_for_each_migrate(self, mock_add_or_update):
+        apps = object()
+        with redirect_stdout(StringIO()):
+            for plan in [[], [], []]:
+                for app_config in self.get_app_configs()[:3]:
+                    post_migrate_update_sites(sender=app_config, apps=apps, plan=plan)
+        self.assertEqual(mock_add_or_update.call_count, 3)
+
+    @patch("edc_sites.utils.add_or_update_django_sites")
+    def test_updates_without_plan(self, mock_add_or_update):
+        with redirect_stdout(StringIO()):
+            post_migrate_update_sites()
+            post_migrate_update_sites(sender=self.get_app_configs()[0], apps=django_apps)
+        self.assertEqual(mock_add_or_update.call_count, 2)
+
+    @patch("edc_sites.utils.add_or_update_django_sites")
+    def test_no_registered_sites(self, mock_add_or_update):
+        sites.initialize()
+        with redirect_stdout(StringIO()):
+            post_migrate_update_sites()
+        mock_add_or_update.assert_not_called()
@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.views.generic import View
+from django.views.generic.base import ContextMixin
+from multisite import SiteID
+
+from edc_sites.site import sites
+from edc_sites.tests import (
+    MULTISITE_VIEWER,
+    SINGLE_SITE,
+    VIEWALLSITES,
+    SiteQueryBudgetTestCaseMixin,
+    SiteTestCaseMixin,
+)
+from edc_sites.view_mixins import SiteViewMixin
+
+from ..admin import TestModelWithSiteAdmin
+from ..models import TestModelWithSite
+
+user_types = [SINGLE_SITE, MULTISITE_VIEWER, VIEWALLSITES]
+
+
+class SiteView(SiteViewMixin, ContextMixin, View):
+    def get(self, request, *args, **kwargs):
+        context = self.get_context_data(**kwargs)
+        return HttpResponse(context.get("site_title"))
+
+
+@override_settings(
+    SITE_ID=SiteID(default=10),
+    EDC_AUTH_SKIP_SITE_AUTHS=True,
+    EDC_AUTH_SKIP_AUTH_UPDATER=True,
+)
+class TestQueryBudgets(SiteQueryBudgetTestCaseMixin, SiteTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.add_sites_test_data()
+
+    def setUp(self):
+        sites.initialize()
+        sites.register(*self.default_sites)
+        for site_id in sites.all():
+            TestModelWithSite.objects.create(site_id=site_id)
+
+    def test_user_types(self):
+        user = self.get_query_budget_user(SINGLE_SITE, TestModelWithSite)
+        self.assertEqual([s.id for s in user.userprofile.sites.all()], [10])
+        self.assertFalse(user.userprofile.is_multisite_viewer)
+        user = self.get_query_budget_user(MULTISITE_VIEWER, TestModelWithSite)
+        self.assertEqual(len(user.userprofile.sites.all()), 6)
+        self.assertTrue(user.userprofile.is_multisite_viewer)
+        user = self.get_query_budget_user(VIEWALLSITES, TestModelWithSite)
+        self.assertTrue(user.has_perm("tests.viewallsites_testmodelwithsite"))
+        self.assertEqual(user, self.get_query_budget_user(VIEWALLSITES, TestModelWithSite))
+
+    def test_budget_exceeded_fails(self):
+        self.assertRaises(AssertionError, self.assertMaxQueries, 0, User.objects.count)
+        self.assertEqual(self.assertMaxQueries(1, User.objects.count), User.objects.count())
+
+    def test_changelist(self):
+        # session, user, permissions and user profile, then the
+        # multisite viewer checks (once per request), the site list
+        # filter and the changelist counts and rows.
+        for user_type, max_queries in [
+            (SINGLE_SITE, 11),
+            (MULTISITE_VIEWER, 17),
+            (VIEWALLSITES, 14),
+        ]:
+            with self.subTest(user_type=user_type):
+                self.assertChangelistQueries(TestModelWithSite, max_queries, user_type)
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        for site_id in sites.all():
+            TestModelWithSite.objects.bulk_create(
+                [TestModelWithSite(site_id=site_id) for _ in range(5)]
+            )
+        with patch.object(
+            TestModelWithSiteAdmin,
+            "list_display",
+            ("__str__", "site_code", "site_name"),
+        ):
+            for user_type, max_queries in [
+                (SINGLE_SITE, 11),
+                (MULTISITE_VIEWER, 17),
+                (VIEWALLSITES, 14),
+            ]:
+                with self.subTest(user_type=user_type):
+                    response = self.assertChangelistQueries(
+                        TestModelWithSite, max_queries, user_type
+                    )
+                    self.assertContains(response, "10 Mochudi")
+
+    def test_changeform(self):
+        obj = TestModelWithSite.objects.get(site_id=10)
+        for user_type, max_queries in [
+            (SINGLE_SITE, 11),
+            (MULTISITE_VIEWER, 16),
+            (VIEWALLSITES, 9),
+        ]:
+            with self.subTest(user_type=user_type):
+                self.assertChangeformQueries(obj, max_queries, user_type)
+
+    def test_site_view(self):
+        for user_type in user_types:
+            with self.subTest(user_type=user_type):
+                response = self.assertSiteViewQueries(
+                    SiteView, 1, user_type, TestModelWithSite
+                )
+                self.assertEqual(response.content, b"Mochudi")
+
+    def test_site_list_filter(self):
+        lookups = self.assertSiteListFilterQueries(TestModelWithSite, 5, VIEWALLSITES)
+        self.assertEqual([x[0] for x in lookups], [10, 20, 30, 40, 50, 60])
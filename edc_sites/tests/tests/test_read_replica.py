@@ -0,0 +1,61 @@
+from django.contrib import admin
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.routers import sync_sites_to_shards
+from edc_sites.site import sites
+
+from ..models import TestModelWithSite
+from ..site_query_budget_test_case_mixin import (
+    MULTISITE_VIEWER,
+    SINGLE_SITE,
+    VIEWALLSITES,
+    SiteQueryBudgetTestCaseMixin,
+)
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False, SITE_ID=10, EDC_SITES_READ_REPLICA="client")
+class TestReadReplica(SiteQueryBudgetTestCaseMixin, SiteTestCaseMixin, TestCase):
+    databases = {"default", "client"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.add_sites_test_data()
+
+    def setUp(self):
+        sites.initialize()
+        sites.register(*self.default_sites)
+        sync_sites_to_shards(aliases=["client"])
+        TestModelWithSite.objects.create(site_id=10, f1="primary")
+        TestModelWithSite.objects.create(site_id=20, f1="primary")
+        TestModelWithSite.objects.using("client").create(site_id=10, f1="replica")
+        TestModelWithSite.objects.using("client").create(site_id=20, f1="replica")
+        self.model_admin = admin.site._registry[TestModelWithSite]
+
+    def get_queryset(self, user_type):
+        request = self.get_query_budget_request(
+            self.get_query_budget_user(user_type, TestModelWithSite)
+        )
+        request._messages = CookieStorage(request)
+        return self.model_admin.get_queryset(request)
+
+    def test_multisite_viewer_reads_from_replica(self):
+        queryset = self.get_queryset(MULTISITE_VIEWER)
+        self.assertEqual(queryset.db, "client")
+        self.assertEqual(
+            sorted(queryset.values_list("site_id", "f1")), [(10, "replica"), (20, "replica")]
+        )
+
+    def test_single_site_user_reads_from_primary(self):
+        queryset = self.get_queryset(SINGLE_SITE)
+        self.assertEqual(queryset.db, "default")
+        self.assertEqual(list(queryset.values_list("site_id", "f1")), [(10, "primary")])
+
+    def test_viewallsites_user_reads_from_primary(self):
+        self.assertEqual(self.get_queryset(VIEWALLSITES).db, "default")
+
+    @override_settings(EDC_SITES_READ_REPLICA=None)
+    def test_not_configured(self):
+        self.assertEqual(self.get_queryset(MULTISITE_VIEWER).db, "default")
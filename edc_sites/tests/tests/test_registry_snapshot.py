@@ -0,0 +1,89 @@
+import hashlib
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.registry_snapshot import (
+    RegistrySnapshotError,
+    get_sites_module_hashes,
+    read_registry_snapshot,
+    write_registry_snapshot,
+)
+from edc_sites.site import sites
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+class TestRegistrySnapshot(SiteTestCaseMixin, TestCase):
+    def setUp(self):
+        self.tmpdir = TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "sites.json"
+        sites.initialize()
+        sites.register(*self.default_sites)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+        super().tearDown()
+
+    def test_write_and_read(self):
+        write_registry_snapshot(self.path, sites.all(aslist=True))
+        single_sites = read_registry_snapshot(self.path)
+        self.assertEqual(single_sites, sites.all(aslist=True))
+        self.assertEqual(
+            [s.languages for s in single_sites], [s.languages for s in self.default_sites]
+        )
+        self.assertEqual(
+            [s.description for s in single_sites],
+            [s.description for s in self.default_sites],
+        )
+
+    def test_load_snapshot(self):
+        write_registry_snapshot(self.path, sites.all(aslist=True))
+        sites.initialize()
+        with override_settings(EDC_SITES_REGISTRY_SNAPSHOT=str(self.path)):
+            sites.autodiscover(verbose=False)
+        self.assertEqual(list(sites.all()), [10, 20, 30, 40, 50, 60])
+        self.assertEqual(sites.snapshot_path, str(self.path))
+
+    def test_hash_mismatch_raises(self):
+        write_registry_snapshot(self.path, sites.all(aslist=True))
+        with override_settings(LANGUAGES=[("en", "English"), ("sw", "Swahili")]):
+            self.assertRaises(RegistrySnapshotError, read_registry_snapshot, self.path)
+
+    def test_tampered_snapshot_raises(self):
+        write_registry_snapshot(self.path, sites.all(aslist=True))
+        with self.path.open() as f:
+            snapshot = json.load(f)
+        snapshot["sites"][0]["domain"] = "somewhere.else.org"
+        with self.path.open("w") as f:
+            json.dump(snapshot, f)
+        self.assertRaises(RegistrySnapshotError, read_registry_snapshot, self.path)
+
+    def test_bad_version_raises(self):
+        with self.path.open("w") as f:
+            json.dump(dict(version=0, hash="", sites=[]), f)
+        self.assertRaises(RegistrySnapshotError, read_registry_snapshot, self.path)
+
+    def test_sites_module_hashes(self):
+        hashes = get_sites_module_hashes("apps")
+        path = Path(__file__).parent.parent.parent / "apps.py"
+        self.assertEqual(
+            hashes["edc_sites.apps"], hashlib.sha256(path.read_bytes()).hexdigest()
+        )
+
+    def test_changed_sites_module_raises(self):
+        with patch(
+            "edc_sites.registry_snapshot.get_sites_module_hashes",
+            return_value={"myapp.sites": "abc"},
+        ):
+            write_registry_snapshot(self.path, sites.all(aslist=True))
+            read_registry_snapshot(self.path)
+        with patch(
+            "edc_sites.registry_snapshot.get_sites_module_hashes",
+            return_value={"myapp.sites": "def"},
+        ):
+            self.assertRaises(RegistrySnapshotError, read_registry_snapshot, self.path)
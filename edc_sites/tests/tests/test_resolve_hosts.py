@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from edc_sites.utils import resolve_hosts
+
+
+def stub_resolver(domain: str) -> str:
+    if domain.startswith("slow"):
+        time.sleep(1)
+    elif domain.startswith("unknown"):
+        raise OSError("Name or service not known")
+    return "127.0.0.1"
+
+
+class TestResolveHosts(SimpleTestCase):
+    def test_resolves_in_order(self):
+        domains = [f"site{i}.clinicedc.org" for i in range(50)]
+        resolutions = resolve_hosts(domains, resolver=stub_resolver, concurrency=5)
+        self.assertEqual([r.domain for r in resolutions], domains)
+        self.assertTrue(all(r.ok for r in resolutions))
+        self.assertTrue(all(r.address == "127.0.0.1" for r in resolutions))
+
+    def test_errors_and_timeouts(self):
+        resolutions = resolve_hosts(
+            ["slow.clinicedc.org", "unknown.clinicedc.org", "ok.clinicedc.org"],
+            resolver=stub_resolver,
+            timeout=0.1,
+        )
+        self.assertIn("timed out", resolutions[0].error)
+        self.assertEqual(resolutions[1].error, "Name or service not known")
+        self.assertIsNone(resolutions[1].address)
+        self.assertTrue(resolutions[2].ok)
+
+    def test_concurrent(self):
+        start = time.perf_counter()
+        resolve_hosts(
+            [f"slow{i}.clinicedc.org" for i in range(10)],
+            resolver=stub_resolver,
+            concurrency=10,
+            timeout=2,
+        )
+        self.assertLess(time.perf_counter() - start, 5)
+
+    def test_abandoned_lookups_keep_one_thread_each(self):
+        event = threading.Event()
+
+        def blocking_resolver(domain: str) -> str:
+            event.wait(5)
+            return "127.0.0.1"
+
+        active_count = threading.active_count()
+        try:
+            resolutions = resolve_hosts(
+                ["site1.clinicedc.org", "site2.clinicedc.org"],
+                resolver=blocking_resolver,
+                concurrency=2,
+                timeout=0.1,
+            )
+            self.assertTrue(all("timed out" in r.error for r in resolutions))
+            self.assertLessEqual(threading.active_count() - active_count, 2)
+        finally:
+            event.set()
+
+    def test_invalid_options(self):
+        self.assertRaises(ValueError, resolve_hosts, ["a.clinicedc.org"], concurrency=0)
+        self.assertRaises(ValueError, resolve_hosts, ["a.clinicedc.org"], timeout=-1)
+
+    def test_queued_lookups_time_out(self):
+        resolutions = resolve_hosts(
+            ["slow1.clinicedc.org", "slow2.clinicedc.org"],
+            resolver=stub_resolver,
+            concurrency=1,
+            timeout=0.1,
+        )
+        self.assertTrue(all("timed out" in r.error for r in resolutions))
+
+    def test_called_from_running_event_loop(self):
+        async def main():
+            return resolve_hosts(["ok.clinicedc.org"], resolver=stub_resolver)
+
+        resolutions = asyncio.run(main())
+        self.assertTrue(resolutions[0].ok)
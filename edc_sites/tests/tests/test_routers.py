@@ -0,0 +1,123 @@
+from unittest.mock import patch
+
+from django.contrib.sites.models import Site
+from django.db import connections
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from edc_sites.models import SiteProfile
+from edc_sites.routers import (
+    fan_out,
+    get_shard_for_site,
+    get_site_ids_by_shard,
+    sync_sites_to_shards,
+)
+from edc_sites.site import sites
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(
+    EDC_SITES_UAT_DOMAIN=False,
+    SITE_ID=10,
+    DATABASE_ROUTERS=["edc_sites.routers.SiteShardRouter"],
+    EDC_SITES_DATABASE_SHARDS={"namibia": "client", 50: "client"},
+)
+class TestSiteShardRouter(SiteTestCaseMixin, TestCase):
+    databases = {"default", "client"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.add_sites_test_data()
+
+    def setUp(self):
+        sites.initialize()
+        sites.register(*self.default_sites)
+        sync_sites_to_shards()
+        for site_id in [10, 20, 50, 60]:
+            with sites.use_site(site_id):
+                TestModelWithSite.objects.create()
+
+    def test_get_shard_for_site(self):
+        self.assertEqual(get_shard_for_site(10), "default")
+        self.assertEqual(get_shard_for_site(50), "client")
+        self.assertEqual(get_shard_for_site(60), "client")
+        self.assertEqual(get_shard_for_site(99), "default")
+        self.assertEqual(
+            get_site_ids_by_shard(), {"default": [10, 20, 30, 40], "client": [50, 60]}
+        )
+
+    def test_sync_sites_to_shards(self):
+        self.assertEqual(
+            list(Site.objects.using("client").values_list("id", "name").order_by("id")),
+            list(Site.objects.values_list("id", "name").order_by("id")),
+        )
+        self.assertEqual(Site.objects.using("client").get(id=60).siteprofile.title, "Windhoek")
+        sync_sites_to_shards()
+        self.assertEqual(Site.objects.using("client").count(), Site.objects.count())
+
+    def test_sync_sites_to_shards_with_and_without_conflict_target(self):
+        """Assert rows are copied with an upsert or, e.g. on MySQL,
+        with a bulk insert and bulk update.
+        """
+        features = connections["client"].features
+        for supports_target in [True, False]:
+            with self.subTest(supports_update_conflicts_with_target=supports_target):
+                Site.objects.using("client").filter(id=20).update(name="gabane")
+                SiteProfile.objects.using("client").filter(site_id=20).update(title="Gabane")
+                SiteProfile.objects.using("client").filter(site_id=30).delete()
+                Site.objects.using("client").filter(id=30).delete()
+                with (
+                    patch.object(
+                        features, "supports_update_conflicts_with_target", supports_target
+                    ),
+                    CaptureQueriesContext(connections["client"]) as ctx,
+                ):
+                    sync_sites_to_shards()
+                self.assertEqual(
+                    any("ON CONFLICT" in q["sql"] for q in ctx.captured_queries),
+                    supports_target,
+                )
+                self.assertEqual(
+                    list(Site.objects.using("client").values_list().order_by("id")),
+                    list(Site.objects.values_list().order_by("id")),
+                )
+                self.assertEqual(
+                    list(SiteProfile.objects.using("client").values_list().order_by("id")),
+                    list(SiteProfile.objects.values_list().order_by("id")),
+                )
+
+    def test_writes_routed_by_site(self):
+        self.assertEqual(
+            sorted(
+                TestModelWithSite.objects.using("default").values_list("site_id", flat=True)
+            ),
+            [10, 20],
+        )
+        self.assertEqual(
+            sorted(
+                TestModelWithSite.objects.using("client").values_list("site_id", flat=True)
+            ),
+            [50, 60],
+        )
+
+    def test_reads_routed_by_current_site(self):
+        self.assertEqual(TestModelWithSite.objects.count(), 2)
+        with sites.use_site(60):
+            self.assertEqual(TestModelWithSite.objects.count(), 2)
+            obj = TestModelWithSite.on_site.get()
+            self.assertEqual(obj._state.db, "client")
+            self.assertEqual(obj.site.name, "windhoek")
+            obj.f1 = "2"
+            obj.save()
+        self.assertEqual(TestModelWithSite.objects.using("client").filter(f1="2").count(), 1)
+
+    def test_fan_out(self):
+        querysets = fan_out(TestModelWithSite.objects.all())
+        self.assertEqual([qs.db for qs in querysets], ["default", "client"])
+        self.assertEqual(sum(qs.count() for qs in querysets), 4)
+        querysets = fan_out(TestModelWithSite.objects.all(), site_ids=[10, 60])
+        self.assertEqual(
+            [list(qs.values_list("site_id", flat=True)) for qs in querysets], [[10], [60]]
+        )
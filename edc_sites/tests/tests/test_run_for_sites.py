@@ -0,0 +1,105 @@
+from unittest.mock import patch
+
+from django.contrib.sites.models import Site
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import override_settings
+
+from edc_sites.current_site import get_current_site_id
+from edc_sites.site import sites
+from edc_sites.utils import run_for_sites
+from edc_sites.utils.site_runner import inherited_connections
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+def get_site_id(single_site, multiplier=1):
+    if single_site.site_id == 60:
+        raise ValueError("Bad site")
+    return single_site.site_id, get_current_site_id() * multiplier
+
+
+def get_worker_connection_state(single_site):
+    inherited = {conn.alias: conn for conn in inherited_connections}
+    return (
+        inherited["default"].connection is not None,
+        connection.connection is None,
+        connection.in_atomic_block,
+    )
+
+
+def get_site_name(single_site):
+    return Site.objects.get(id=get_current_site_id()).name
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False, SITE_ID=10)
+class TestRunForSites(SiteTestCaseMixin, TestCase):
+    def setUp(self):
+        sites.initialize()
+        sites.register(*self.default_sites)
+
+    def test_run_for_sites(self):
+        result = run_for_sites(get_site_id, max_workers=2)
+        self.assertEqual([r.site_id for r in result.results], [10, 20, 30, 40, 50, 60])
+        self.assertEqual(
+            result.as_dict(),
+            {10: (10, 10), 20: (20, 20), 30: (30, 30), 40: (40, 40), 50: (50, 50)},
+        )
+        self.assertFalse(result.ok)
+        self.assertEqual([r.site_id for r in result.errors], [60])
+        self.assertEqual(result.errors[0].error, "ValueError: Bad site")
+        self.assertIn("Traceback", result.errors[0].traceback)
+        self.assertTrue(all(r.elapsed >= 0 for r in result.results))
+        self.assertEqual(get_current_site_id(), 10)
+
+    def test_run_for_sites_args(self):
+        result = run_for_sites(get_site_id, 2, site_ids=[20, 30])
+        self.assertEqual(result.as_dict(), {20: (20, 40), 30: (30, 60)})
+        result = run_for_sites(get_site_id, site_ids=[20], multiplier=3)
+        self.assertEqual(result.as_dict(), {20: (20, 60)})
+
+    def test_run_for_sites_by_country(self):
+        country = sites.get(10).country
+        result = run_for_sites(get_site_id, country=country)
+        self.assertEqual(
+            [r.site_id for r in result.results],
+            [s.site_id for s in sites.get_by_country(country, aslist=True)],
+        )
+
+    def test_run_for_sites_invalid_executor(self):
+        self.assertRaises(ValueError, run_for_sites, get_site_id, executor="celery")
+
+    def test_run_for_sites_process(self):
+        """Assert the caller's connection and transaction are left
+        as they are.
+        """
+        Site.objects.create(id=99, domain="gabane.bw.clinicedc.org", name="gabane")
+        self.assertTrue(connection.in_atomic_block)
+        with patch.object(connection, "close", wraps=connection.close) as mock_close:
+            result = run_for_sites(get_site_id, site_ids=[10, 20], executor="process")
+        mock_close.assert_not_called()
+        self.assertEqual(result.as_dict(), {10: (10, 10), 20: (20, 20)})
+        self.assertFalse(connection.needs_rollback)
+        self.assertTrue(Site.objects.filter(id=99).exists())
+
+    def test_run_for_sites_process_worker_connections(self):
+        """Assert a forked worker sets aside the connections it
+        inherits, without closing them, and starts with its own.
+        """
+        self.assertIsNotNone(connection.connection)
+        result = run_for_sites(get_worker_connection_state, site_ids=[10], executor="process")
+        self.assertEqual(result.as_dict(), {10: (True, True, False)})
+        self.assertEqual(inherited_connections, [])
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False, SITE_ID=10)
+class TestRunForSitesQueries(SiteTestCaseMixin, TransactionTestCase):
+    def setUp(self):
+        self.add_sites_test_data()
+
+    def test_run_for_sites_queries(self):
+        result = run_for_sites(get_site_name, site_ids=[10, 20, 30], max_workers=2)
+        self.assertTrue(result.ok, result.errors)
+        self.assertEqual(
+            result.as_dict(), {site_id: sites.get(site_id).name for site_id in [10, 20, 30]}
+        )
@@ -0,0 +1,68 @@
+import dataclasses
+
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.models import SiteProfile
+from edc_sites.site import SiteNotRegistered, sites
+from edc_sites.site_cache import VERSION_KEY
+from edc_sites.utils import add_or_update_django_sites
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False)
+class TestSiteCache(SiteTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.add_sites_test_data()
+
+    def setUp(self):
+        cache.clear()
+        sites.initialize()
+        sites.register(*self.default_sites)
+
+    def test_cache_key(self):
+        key = sites.cache_key(10, "dashboard", "123-4")
+        self.assertTrue(key.startswith("edc_sites.site.10."))
+        self.assertTrue(key.endswith(".dashboard.123-4"))
+        self.assertEqual(sites.cache_key(10, "dashboard", "123-4"), key)
+        self.assertEqual(sites.cache_key(Site.objects.get(id=10), "dashboard", "123-4"), key)
+        self.assertNotEqual(sites.cache_key(20, "dashboard", "123-4"), key)
+        self.assertRaises(SiteNotRegistered, sites.cache_key, 99, "dashboard")
+
+    def test_invalidate_one_site(self):
+        key10, key20 = sites.cache_key(10, "a"), sites.cache_key(20, "a")
+        sites.invalidate_cache(10)
+        self.assertNotEqual(sites.cache_key(10, "a"), key10)
+        self.assertEqual(sites.cache_key(20, "a"), key20)
+
+    def test_invalidate_all_sites(self):
+        key10, key20 = sites.cache_key(10, "a"), sites.cache_key(20, "a")
+        sites.invalidate_cache()
+        self.assertNotEqual(sites.cache_key(10, "a"), key10)
+        self.assertNotEqual(sites.cache_key(20, "a"), key20)
+
+    def test_invalidated_on_site_and_site_profile_change(self):
+        key = sites.cache_key(10, "a")
+        site_obj = Site.objects.get(id=10)
+        site_obj.save()
+        self.assertNotEqual(sites.cache_key(10, "a"), key)
+        key = sites.cache_key(10, "a")
+        SiteProfile.objects.get(site_id=10).save()
+        self.assertNotEqual(sites.cache_key(10, "a"), key)
+
+    def test_unchanged_sync_does_not_invalidate(self):
+        key = sites.cache_key(10, "a")
+        add_or_update_django_sites(verbose=False)
+        self.assertEqual(sites.cache_key(10, "a"), key)
+        sites._registry[10] = dataclasses.replace(sites.get(10), title="New Title")
+        add_or_update_django_sites(verbose=False)
+        self.assertNotEqual(sites.cache_key(10, "a"), key)
+
+    def test_evicted_version_not_reused(self):
+        key = sites.cache_key(10, "a")
+        cache.delete(VERSION_KEY.format(key=10))
+        self.assertNotEqual(sites.cache_key(10, "a"), key)
@@ -0,0 +1,80 @@
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.models import SiteProfile
+from edc_sites.site import sites
+from edc_sites.site_identity_map import site_identity_map
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False, SITE_ID=10)
+class TestSiteIdentityMap(SiteTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.add_sites_test_data()
+
+    def setUp(self):
+        sites.initialize()
+        sites.register(*self.default_sites)
+        for site_id in [10, 20, 60]:
+            with sites.use_site(site_id):
+                TestModelWithSite.objects.create()
+                TestModelWithSite.objects.create()
+
+    def test_loads_in_one_query(self):
+        site_identity_map.clear()
+        with self.assertNumQueries(1):
+            self.assertEqual(site_identity_map.get(10).name, "mochudi")
+            self.assertEqual(site_identity_map.get(60).name, "windhoek")
+        self.assertIsNone(site_identity_map.get(99))
+        self.assertIsNone(site_identity_map.get(None))
+
+    def test_site_access_without_queries(self):
+        objs = list(TestModelWithSite.objects.order_by("site_id"))
+        site_identity_map.get(10)
+        with self.assertNumQueries(0):
+            site_ids = [obj.site.id for obj in objs]
+        self.assertEqual(site_ids, [10, 10, 20, 20, 60, 60])
+        self.assertEqual(objs[0].site, objs[1].site)
+        self.assertIsNot(objs[0].site, objs[1].site)
+
+    def test_instances_not_shared(self):
+        site = site_identity_map.get(10)
+        site.name = "changed"
+        self.assertEqual(site.siteprofile.title, "Mochudi")
+        site = site_identity_map.get(10)
+        self.assertEqual(site.name, "mochudi")
+        self.assertEqual(site._state.fields_cache, {})
+        self.assertFalse(site._state.adding)
+        self.assertEqual(site._state.db, "default")
+
+    def test_cleared_on_site_profile_save_and_delete(self):
+        site_identity_map.get(10)
+        SiteProfile.objects.get(site_id=10).save()
+        self.assertEqual(site_identity_map._sites, {})
+        site_identity_map.get(10)
+        SiteProfile.objects.filter(site_id=10).delete()
+        self.assertEqual(site_identity_map._sites, {})
+
+    def test_cleared_on_save_and_delete(self):
+        site_identity_map.get(10)
+        site = Site.objects.get(id=10)
+        site.name = "mochudi_changed"
+        site.save()
+        self.assertEqual(
+            TestModelWithSite.objects.filter(site_id=10)[0].site.name, "mochudi_changed"
+        )
+        site_identity_map.get(10)
+        Site.objects.create(id=99, name="new", domain="new.clinicedc.org")
+        self.assertEqual(site_identity_map.get(99).name, "new")
+        Site.objects.filter(id=99).delete()
+        self.assertIsNone(site_identity_map.get(99))
+
+    @override_settings(EDC_SITES_SITE_IDENTITY_MAP=False)
+    def test_disabled(self):
+        obj = TestModelWithSite.objects.all()[0]
+        with self.assertNumQueries(1):
+            self.assertEqual(obj.site.id, 10)
@@ -0,0 +1,80 @@
+from django.db.models import Count
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.site import sites
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False, SITE_ID=10)
+class TestSiteQuerySet(SiteTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.add_sites_test_data()
+        for site_id in [10, 20, 60]:
+            with sites.use_site(site_id):
+                TestModelWithSite.objects.create()
+                TestModelWithSite.objects.create()
+
+    def setUp(self):
+        sites.initialize()
+        sites.register(*self.default_sites)
+
+    def test_annotations_without_joins(self):
+        queryset = (
+            TestModelWithSite.objects.with_site_name()
+            .with_site_description()
+            .with_country()
+            .order_by("site_id")
+        )
+        self.assertNotIn("JOIN", str(queryset.query))
+        with self.assertNumQueries(1):
+            rows = list(
+                queryset.values_list(
+                    "site_id", "site_name", "site_description", "site_country"
+                )
+            )
+        self.assertEqual(rows[0], (10, "mochudi", "Mochudi", "botswana"))
+        self.assertEqual(rows[-1], (60, "windhoek", "Windhoek", "namibia"))
+
+    def test_annotation_names(self):
+        obj = TestModelWithSite.objects.with_country(name="country").filter(site_id=60)[0]
+        self.assertEqual(obj.country, "namibia")
+
+    def test_group_by_country(self):
+        self.assertEqual(
+            list(
+                TestModelWithSite.objects.with_country()
+                .values("site_country")
+                .annotate(count=Count("id"))
+                .order_by("site_country")
+            ),
+            [
+                {"site_country": "botswana", "count": 4},
+                {"site_country": "namibia", "count": 2},
+            ],
+        )
+
+    def test_on_country(self):
+        queryset = TestModelWithSite.objects.on_country("namibia")
+        self.assertNotIn("JOIN", str(queryset.query))
+        self.assertEqual(queryset.count(), 2)
+        self.assertEqual(TestModelWithSite.objects.on_country("botswana").count(), 4)
+        self.assertEqual(TestModelWithSite.objects.on_country("tanzania").count(), 0)
+
+    def test_current_site_manager(self):
+        self.assertEqual(TestModelWithSite.on_site.on_country("botswana").count(), 2)
+        self.assertEqual(TestModelWithSite.on_site.on_country("namibia").count(), 0)
+        self.assertEqual(
+            set(
+                TestModelWithSite.on_site.with_country().values_list("site_country", flat=True)
+            ),
+            {"botswana"},
+        )
+
+    def test_empty_registry(self):
+        sites.initialize()
+        obj = TestModelWithSite.objects.with_country().first()
+        self.assertIsNone(obj.site_country)
@@ -0,0 +1,74 @@
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import override_settings
+
+from edc_sites.site import sites
+from edc_sites.utils import get_site_model_mixin_models, get_site_row_counts
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+def create_rows():
+    for site_id, rows in [(10, 3), (20, 2), (60, 1)]:
+        with sites.use_site(site_id):
+            for _ in range(rows):
+                TestModelWithSite.objects.create()
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False, SITE_ID=10)
+class TestSiteRowCounts(SiteTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.add_sites_test_data()
+        create_rows()
+
+    def setUp(self):
+        cache.clear()
+        sites.initialize()
+        sites.register(*self.default_sites)
+
+    def test_get_site_model_mixin_models(self):
+        self.assertIn(TestModelWithSite, get_site_model_mixin_models())
+
+    def test_get_site_row_counts(self):
+        models = get_site_model_mixin_models()
+        with self.assertNumQueries(len(models)):
+            row_counts = get_site_row_counts()
+        self.assertEqual(row_counts.counts["tests.testmodelwithsite"], {10: 3, 20: 2, 60: 1})
+        self.assertEqual(row_counts.by_model()["tests.testmodelwithsite"], 6)
+        self.assertEqual(row_counts.by_site()[10], 3)
+        self.assertIsNotNone(row_counts.created)
+
+    def test_get_site_row_counts_is_cached(self):
+        get_site_row_counts()
+        TestModelWithSite.objects.create()
+        with self.assertNumQueries(0):
+            row_counts = get_site_row_counts()
+        self.assertEqual(row_counts.counts["tests.testmodelwithsite"][10], 3)
+        row_counts = get_site_row_counts(refresh=True)
+        self.assertEqual(row_counts.counts["tests.testmodelwithsite"][10], 4)
+
+    @override_settings(EDC_SITES_ROW_COUNTS_TIMEOUT=0)
+    def test_get_site_row_counts_timeout(self):
+        get_site_row_counts()
+        with self.assertNumQueries(len(get_site_model_mixin_models())):
+            get_site_row_counts()
+
+    def test_get_site_row_counts_for_models_not_cached(self):
+        get_site_row_counts(models=[TestModelWithSite])
+        with self.assertNumQueries(1):
+            row_counts = get_site_row_counts(models=[TestModelWithSite])
+        self.assertEqual(list(row_counts.counts), ["tests.testmodelwithsite"])
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False, SITE_ID=10)
+class TestSiteRowCountsParallel(SiteTestCaseMixin, TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+        self.add_sites_test_data()
+        create_rows()
+
+    def test_get_site_row_counts_parallel(self):
+        row_counts = get_site_row_counts(max_workers=4)
+        self.assertEqual(row_counts.counts["tests.testmodelwithsite"], {10: 3, 20: 2, 60: 1})
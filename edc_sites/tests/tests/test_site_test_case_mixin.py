@@ -0,0 +1,81 @@
+import dataclasses
+
+from django.contrib.sites.models import Site
+from django.db import connection
+from django.db.models import ProtectedError
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+from multisite.models import Alias
+
+from edc_sites.models import SiteProfile
+from edc_sites.site import sites
+from edc_sites.site_identity_map import site_identity_map
+from edc_sites.utils import get_sites_diff
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False)
+class TestSiteTestCaseMixin(SiteTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.create(id=99, name="old", domain="old.clinicedc.org")
+        cls.add_sites_test_data()
+
+    def test_rows_seeded(self):
+        self.assertEqual(list(sites.all()), [10, 20, 30, 40, 50, 60])
+        # unregistered rows are not deleted
+        self.assertEqual(
+            list(Site.objects.values_list("id", flat=True).order_by("id")),
+            [10, 20, 30, 40, 50, 60, 99],
+        )
+        self.assertEqual(SiteProfile.objects.get(site_id=60).title, "Windhoek")
+        self.assertEqual(
+            SiteProfile.objects.get(site_id=60).get_languages(), {"en": "English"}
+        )
+        self.assertFalse(get_sites_diff().has_changes)
+
+    def test_nothing_written_if_rows_match(self):
+        with self.assertNumQueries(2):
+            self.add_sites_test_data()
+
+    def test_only_changed_rows_saved(self):
+        SiteProfile.objects.filter(site_id=60).update(title="Changed")
+        with CaptureQueriesContext(connection) as ctx:
+            self.add_sites_test_data()
+        statements = [q["sql"].split()[0] for q in ctx.captured_queries]
+        self.assertEqual(statements.count("INSERT"), 0)
+        self.assertEqual(statements.count("UPDATE"), 1)
+        self.assertEqual(SiteProfile.objects.get(site_id=60).title, "Windhoek")
+
+    def test_canonical_alias_created(self):
+        single_site = dataclasses.replace(
+            self.default_sites[0], site_id=70, name="gabane", domain="gabane.bw.clinicedc.org"
+        )
+        self.add_sites_test_data(single_sites=[*self.default_sites, single_site])
+        self.assertEqual(Site.objects.get(id=70).domain, "gabane.bw.clinicedc.org")
+        self.assertTrue(Alias.objects.get(domain="gabane.bw.clinicedc.org").is_canonical)
+
+    def test_existing_site_model_mixin_rows(self):
+        obj = TestModelWithSite.objects.create(site_id=10)
+        single_sites = [
+            dataclasses.replace(s, title=f"{s.title}!") for s in self.default_sites
+        ]
+        self.add_sites_test_data(single_sites=single_sites)
+        self.assertEqual(SiteProfile.objects.get(site_id=10).title, "Mochudi!")
+        obj.refresh_from_db()
+        self.assertEqual(obj.site_id, 10)
+
+    def test_reset_site_model(self):
+        key = sites.cache_key(10, "a")
+        site_identity_map.get(10)
+        sites.reset_site_model()
+        self.assertFalse(SiteProfile.objects.exists())
+        self.assertFalse(Site.objects.exists())
+        self.assertEqual(site_identity_map._sites, {})
+        self.assertNotEqual(sites.cache_key(10, "a"), key)
+
+    def test_reset_site_model_protected(self):
+        TestModelWithSite.objects.create(site_id=10)
+        self.assertRaises(ProtectedError, sites.reset_site_model)
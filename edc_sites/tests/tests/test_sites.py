@@ -470,3 +470,11 @@ class TestSites(SiteTestCaseMixin, TestCase):
             get_message_text(messages.ERROR),
             [msg_obj.message for msg_obj in get_messages(response.wsgi_request)],
         )
+
+    def test_autodiscover_skips_apps_without_module(self):
+        sites.initialize()
+        sites.register(*self.default_sites)
+        registry = sites.all()
+        sites.autodiscover(module_name="sites_does_not_exist", verbose=False)
+        self.assertIs(sites.all(), registry)
+        self.assertEqual(list(sites.all()), [10, 20, 30, 40, 50, 60])
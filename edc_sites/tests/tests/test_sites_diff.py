@@ -0,0 +1,59 @@
+import dataclasses
+
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.models import SiteProfile
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites, apply_sites_diff, get_sites_diff
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False)
+class TestSitesDiff(SiteTestCaseMixin, TestCase):
+    def setUp(self):
+        sites.initialize(initialize_site_model=True)
+        sites.register(*self.default_sites)
+
+    def test_diff_on_empty_tables(self):
+        diff = get_sites_diff()
+        self.assertEqual([s.site_id for s in diff.site_inserts], [10, 20, 30, 40, 50, 60])
+        self.assertEqual([s.site_id for s in diff.profile_inserts], [10, 20, 30, 40, 50, 60])
+        self.assertTrue(diff.has_changes)
+
+    def test_no_changes_in_two_queries(self):
+        add_or_update_django_sites(verbose=False)
+        with self.assertNumQueries(2):
+            diff = get_sites_diff()
+        self.assertFalse(diff.has_changes)
+        self.assertEqual(diff.as_lines(), [])
+
+    def test_apply_only_changed(self):
+        add_or_update_django_sites(verbose=False)
+        single_site = sites.get(20)
+        sites._registry[20] = dataclasses.replace(
+            single_site, domain="molepolole.na.clinicedc.org", title="New Title"
+        )
+        diff = get_sites_diff()
+        self.assertEqual([s.site_id for s in diff.changed_single_sites], [20])
+        self.assertEqual(
+            diff.site_updates[0][1],
+            {"domain": ("molepolole.bw.clinicedc.org", "molepolole.na.clinicedc.org")},
+        )
+        self.assertEqual(apply_sites_diff(diff), 1)
+        self.assertEqual(Site.objects.get(id=20).domain, "molepolole.na.clinicedc.org")
+        self.assertEqual(SiteProfile.objects.get(site_id=20).title, "New Title")
+        self.assertFalse(get_sites_diff().has_changes)
+
+    def test_unregistered_and_example_com(self):
+        add_or_update_django_sites(verbose=False)
+        Site.objects.create(id=99, name="example.com", domain="example.com")
+        Site.objects.create(id=98, name="old", domain="old.clinicedc.org")
+        diff = get_sites_diff()
+        self.assertEqual(diff.site_deletes, [(99, "example.com")])
+        self.assertEqual(diff.unregistered, [(98, "old.clinicedc.org")])
+        apply_sites_diff(diff)
+        self.assertFalse(Site.objects.filter(id=99).exists())
+        self.assertTrue(Site.objects.filter(id=98).exists())
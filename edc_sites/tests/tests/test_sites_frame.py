@@ -0,0 +1,71 @@
+import dataclasses
+from importlib.util import find_spec
+from unittest import skipIf
+
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.single_site import SingleSite
+from edc_sites.site import SitesError, sites
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@skipIf(not find_spec("pandas"), "pandas not installed")
+@override_settings(EDC_SITES_UAT_DOMAIN=False)
+class TestSitesFrame(SiteTestCaseMixin, TestCase):
+    def setUp(self):
+        sites.initialize()
+        sites.register(*self.default_sites)
+
+    def test_to_frame(self):
+        frame = sites.to_frame()
+        self.assertEqual(list(frame.index), [10, 20, 30, 40, 50, 60])
+        self.assertEqual(frame.loc[60, "country"], "namibia")
+        self.assertEqual(frame.loc[10, "description"], "Mochudi")
+        self.assertTrue(all(str(dtype) == "category" for dtype in frame.dtypes))
+
+    def test_map_series(self):
+        import pandas as pd
+
+        series = pd.Series([10, 60, 99, 20], index=["a", "b", "c", "d"])
+        mapped = sites.map_series(series, "country")
+        self.assertEqual(str(mapped.dtype), "category")
+        self.assertEqual(list(mapped.index), ["a", "b", "c", "d"])
+        self.assertEqual(mapped["a"], "botswana")
+        self.assertEqual(mapped["b"], "namibia")
+        self.assertTrue(pd.isna(mapped["c"]))
+        self.assertEqual(
+            list(sites.map_series(pd.Series([20, 10]), "description")),
+            ["Molepolole", "Mochudi"],
+        )
+
+    def test_map_series_invalid_attr(self):
+        import pandas as pd
+
+        self.assertRaises(SitesError, sites.map_series, pd.Series([10]), "languages")
+
+    def test_frame_refreshed_on_register(self):
+        import pandas as pd
+
+        sites.to_frame()
+        sites.register(
+            SingleSite(70, "kampala", domain="kampala.ug.clinicedc.org", country="uganda")
+        )
+        self.assertEqual(list(sites.map_series(pd.Series([70]), "country")), ["uganda"])
+
+    def test_map_series_empty_registry(self):
+        import pandas as pd
+
+        sites.initialize()
+        mapped = sites.map_series(pd.Series([10, 60]), "country")
+        self.assertEqual(len(mapped), 2)
+        self.assertTrue(mapped.isna().all())
+
+    def test_frame_refreshed_on_initialize(self):
+        import pandas as pd
+
+        sites.to_frame()
+        sites.initialize()
+        sites.register(*[dataclasses.replace(s, country="uganda") for s in self.default_sites])
+        self.assertEqual(list(sites.map_series(pd.Series([20]), "country")), ["uganda"])
@@ -0,0 +1,38 @@
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.single_site import SingleSite
+from edc_sites.startup_profiler import StartupProfiler, startup_profiler
+
+
+class TestStartupProfiler(TestCase):
+    def tearDown(self):
+        startup_profiler.reset()
+        super().tearDown()
+
+    def test_disabled_records_nothing(self):
+        profiler = StartupProfiler()
+        with profiler.phase("phase_one"):
+            Site.objects.count()
+        self.assertEqual(profiler.phases, {})
+
+    @override_settings(EDC_SITES_PROFILE_STARTUP=True)
+    def test_records_time_and_queries(self):
+        profiler = StartupProfiler(report_at_exit=False)
+        with profiler.phase("phase_one"):
+            Site.objects.count()
+            Site.objects.count()
+        with profiler.phase("phase_one"):
+            pass
+        stats = profiler.phases.get("phase_one")
+        self.assertEqual(stats.calls, 2)
+        self.assertEqual(stats.queries, 2)
+        self.assertGreater(stats.seconds, 0)
+        self.assertIn("phase_one", profiler.summary())
+
+    @override_settings(EDC_SITES_PROFILE_STARTUP=True)
+    def test_single_site_languages_phase(self):
+        startup_profiler.reset()
+        SingleSite(10, "mochudi", domain="mochudi.bw.clinicedc.org")
+        self.assertEqual(startup_profiler.phases.get("single_site.languages").calls, 1)
@@ -0,0 +1,49 @@
+from django.test import TestCase
+from django.test.utils import override_settings
+from multisite.models import Alias
+
+from edc_sites.site import sites
+from edc_sites.utils import sync_multisite_aliases
+from edc_sites.utils.multisite_aliases import get_registry_aliases
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False)
+class TestSyncMultisiteAliases(SiteTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.add_sites_test_data()
+
+    def setUp(self):
+        sites.initialize()
+        sites.register(*self.default_sites)
+
+    def test_registry_aliases(self):
+        aliases = get_registry_aliases(sites.all(aslist=True), include_uat=True)
+        self.assertEqual(aliases.get("mochudi.bw.clinicedc.org"), (10, True))
+        self.assertEqual(aliases.get("mochudi.uat.bw.clinicedc.org"), (10, None))
+        self.assertEqual(len(aliases), 12)
+
+    def test_sync_is_idempotent(self):
+        sync_multisite_aliases()
+        result = sync_multisite_aliases()
+        self.assertEqual(result.created, 0)
+        self.assertEqual(result.deleted, 0)
+        self.assertEqual(result.unchanged, 6)
+
+    def test_sync_with_uat_aliases(self):
+        result = sync_multisite_aliases(include_uat=True)
+        self.assertEqual(result.created + result.unchanged, 12)
+        self.assertEqual(Alias.objects.get(domain="mochudi.uat.bw.clinicedc.org").site_id, 10)
+        self.assertIsNone(
+            Alias.objects.get(domain="mochudi.uat.bw.clinicedc.org").is_canonical
+        )
+        self.assertTrue(Alias.objects.get(domain="mochudi.bw.clinicedc.org").is_canonical)
+
+    def test_custom_alias_is_kept(self):
+        sync_multisite_aliases()
+        Alias.objects.create(domain="mochudi.example.org", site_id=10)
+        result = sync_multisite_aliases()
+        self.assertEqual(result.deleted, 0)
+        self.assertTrue(Alias.objects.filter(domain="mochudi.example.org").exists())
@@ -0,0 +1,128 @@
+import dataclasses
+import json
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.contrib.sites.models import Site
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.management.commands.sync_sites import Command
+from edc_sites.registry_snapshot import read_registry_snapshot
+from edc_sites.site import Sites, sites
+from edc_sites.utils import get_sites_diff
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False)
+class TestSyncSitesCommand(SiteTestCaseMixin, TestCase):
+    def setUp(self):
+        sites.initialize(initialize_site_model=True)
+        sites.register(*self.default_sites)
+
+    def call_command_as_json(self, *args) -> dict:
+        stdout = StringIO()
+        call_command("sync_sites", "--format", "json", *args, stdout=stdout)
+        return json.loads(stdout.getvalue())
+
+    def test_json(self):
+        report = self.call_command_as_json()
+        self.assertEqual(report.get("registry_size"), 6)
+        self.assertEqual(report.get("rows_changed"), 6)
+        self.assertIn("mochudi.bw.clinicedc.org", report.get("suggested_allowed_hosts"))
+        self.assertIn("apply_sites_diff", [phase["name"] for phase in report.get("phases")])
+        self.assertEqual(Site.objects.filter(id__in=list(sites.all())).count(), 6)
+        report = self.call_command_as_json()
+        self.assertEqual(report.get("rows_changed"), 0)
+
+    def test_cache_invalidated(self):
+        report = self.call_command_as_json()
+        self.assertEqual(report.get("cache_invalidated"), [10, 20, 30, 40, 50, 60])
+        key = sites.cache_key(20, "a")
+        sites._registry[20] = dataclasses.replace(sites.get(20), title="New Title")
+        report = self.call_command_as_json("--diff")
+        self.assertEqual(report.get("cache_invalidated"), [20])
+        self.assertNotEqual(sites.cache_key(20, "a"), key)
+
+    def test_diff_applied_once(self):
+        with (
+            patch(
+                "edc_sites.management.commands.sync_sites.get_sites_diff",
+                wraps=get_sites_diff,
+            ) as mock_diff,
+            patch(
+                "edc_sites.management.commands.sync_sites.add_or_update_django_sites"
+            ) as mock_add_or_update,
+        ):
+            self.call_command_as_json()
+        mock_diff.assert_called_once()
+        mock_add_or_update.assert_not_called()
+
+    def test_text_output_skips_diff(self):
+        with (
+            patch("edc_sites.management.commands.sync_sites.get_sites_diff") as mock_diff,
+            redirect_stdout(StringIO()),
+        ):
+            call_command("sync_sites", stdout=StringIO())
+        mock_diff.assert_not_called()
+        self.assertEqual(Site.objects.filter(id__in=list(sites.all())).count(), 6)
+
+    def test_dry_run(self):
+        report = self.call_command_as_json("--dry-run")
+        self.assertTrue(report.get("dry_run"))
+        self.assertEqual(report.get("rows_changed"), 6)
+        self.assertFalse(Site.objects.filter(id__in=list(sites.all())).exists())
+
+    def test_ping_hosts_with_stub_resolver(self):
+        with patch.object(Command, "host_resolver", staticmethod(lambda domain: "10.0.0.1")):
+            report = self.call_command_as_json("--ping-hosts")
+        self.assertEqual(len(report.get("hosts")), 6)
+        self.assertTrue(all(host["address"] == "10.0.0.1" for host in report.get("hosts")))
+
+    def test_invalid_ping_options(self):
+        for args in [["--ping-concurrency", "0"], ["--ping-timeout", "0"]]:
+            with self.subTest(args=args):
+                self.assertRaises(
+                    CommandError, self.call_command_as_json, "--ping-hosts", *args
+                )
+
+    def test_json_only_on_command_stdout(self):
+        stdout, sys_stdout = StringIO(), StringIO()
+        with redirect_stdout(sys_stdout):
+            call_command("sync_sites", "--format", "json", stdout=stdout)
+        self.assertEqual(json.loads(stdout.getvalue()).get("registry_size"), 6)
+        self.assertEqual(sys_stdout.getvalue(), "")
+
+    def test_json_output_to_file(self):
+        stdout = StringIO()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "sync_sites.json"
+            call_command("sync_sites", "--format", "json", "--output", path, stdout=stdout)
+            self.assertEqual(json.loads(path.read_text()).get("registry_size"), 6)
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertRaises(CommandError, call_command, "sync_sites", "--output", path)
+
+    def test_write_snapshot_autodiscovers(self):
+        """Assert a registry loaded from a snapshot is rebuilt with
+        autodiscover before the snapshot is written.
+        """
+
+        def autodiscover(module_name=None, verbose=True, use_snapshot=True):
+            self.assertFalse(use_snapshot)
+            sites.register(*self.default_sites)
+
+        sites.initialize()
+        sites.register(*self.default_sites[:2])
+        sites.snapshot_path = "stale.json"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "sites.json"
+            with patch.object(Sites, "autodiscover", staticmethod(autodiscover)):
+                report = self.call_command_as_json("--write-snapshot", path)
+            self.assertEqual(report.get("registry_size"), 6)
+            self.assertEqual(len(read_registry_snapshot(path)), 6)
+        self.assertIsNone(sites.snapshot_path)
@@ -0,0 +1,84 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from edc_sites.current_site import get_current_site_id, get_site_id_override
+from edc_sites.site import SiteNotRegistered, sites
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False, SITE_ID=10)
+class TestUseSite(SiteTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.add_sites_test_data()
+
+    def setUp(self):
+        sites.initialize()
+        sites.register(*self.default_sites)
+
+    def test_use_site(self):
+        self.assertIsNone(get_site_id_override())
+        with sites.use_site(20) as single_site:
+            self.assertEqual(single_site.site_id, 20)
+            self.assertEqual(get_current_site_id(), 20)
+            self.assertEqual(sites.get_current_site().site_id, 20)
+            with sites.use_site(30):
+                self.assertEqual(sites.get_current_site_obj().id, 30)
+            self.assertEqual(get_current_site_id(), 20)
+        self.assertIsNone(get_site_id_override())
+        self.assertEqual(get_current_site_id(), 10)
+
+    def test_use_site_not_registered(self):
+        with self.assertRaises(SiteNotRegistered):
+            with sites.use_site(99):
+                pass
+
+    def test_use_site_on_create_and_manager(self):
+        TestModelWithSite.objects.create()
+        for site_id in [20, 30]:
+            with sites.use_site(site_id):
+                obj = TestModelWithSite.objects.create()
+                self.assertEqual(obj.site.id, site_id)
+                self.assertEqual(TestModelWithSite.on_site.count(), 1)
+        self.assertEqual(TestModelWithSite.on_site.get().site.id, 10)
+
+    def test_use_site_caches_site(self):
+        with sites.use_site(20):
+            TestModelWithSite.objects.create()
+        with sites.use_site(20):
+            with CaptureQueriesContext(connection) as ctx:
+                TestModelWithSite.objects.create()
+        self.assertEqual(
+            [q["sql"] for q in ctx.captured_queries if "django_site" in q["sql"]], []
+        )
+
+    def test_use_site_threads(self):
+        def get_site_id(site_id):
+            with sites.use_site(site_id):
+                return get_current_site_id()
+
+        with sites.use_site(20):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                site_ids = list(executor.map(get_site_id, [30, 40, 50, 60]))
+                # a new thread does not inherit the override
+                self.assertEqual(executor.submit(get_current_site_id).result(), 10)
+            self.assertEqual(get_current_site_id(), 20)
+        self.assertEqual(site_ids, [30, 40, 50, 60])
+
+    def test_use_site_asyncio(self):
+        async def get_site_id(site_id):
+            with sites.use_site(site_id):
+                await asyncio.sleep(0)
+                return get_current_site_id()
+
+        async def main():
+            return await asyncio.gather(*[get_site_id(i) for i in [30, 40, 50, 60]])
+
+        self.assertEqual(asyncio.run(main()), [30, 40, 50, 60])
+        self.assertEqual(get_current_site_id(), 10)
@@ -1,8 +1,38 @@
+from importlib import import_module
+
 from .add_or_update_django_sites import add_or_update_django_sites
+from .apply_sites_diff import apply_sites_diff
+from .get_allowed_hosts import AllowedHosts, get_allowed_hosts
 from .get_message_text import get_message_text
 from .get_or_create_site_obj import get_or_create_site_obj
 from .get_or_create_site_profile_obj import get_or_create_site_profile_obj
 from .get_site_model_cls import get_site_model_cls
+from .get_sites_diff import SitesDiff, get_sites_diff
 from .has_profile_or_raise import has_profile_or_raise
-from .insert_into_domain import insert_into_domain
+from .insert_into_domain import get_uat_variant, insert_into_domain
 from .valid_site_for_subject_or_raise import valid_site_for_subject_or_raise
+
+# imported on first access, these are not needed to import edc_sites.site.
+# The submodules are not named after their functions so that importing
+# a submodule does not replace the function on this package.
+lazy_imports = {
+    "ExportedFile": "site_data_export",
+    "export_site_data": "site_data_export",
+    "SiteRowCounts": "site_row_counts",
+    "get_site_model_mixin_models": "site_row_counts",
+    "get_site_row_counts": "site_row_counts",
+    "HostResolution": "host_resolution",
+    "resolve_hosts": "host_resolution",
+    "validate_resolve_options": "host_resolution",
+    "SiteRunResult": "site_runner",
+    "SitesRunResult": "site_runner",
+    "run_for_sites": "site_runner",
+    "AliasSyncResult": "multisite_aliases",
+    "sync_multisite_aliases": "multisite_aliases",
+}
+
+
+def __getattr__(name: str):
+    if module_name := lazy_imports.get(name):
+        return getattr(import_module(f"{__name__}.{module_name}"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -58,8 +58,9 @@ def add_or_update_django_sites(
             continue
         if verbose:
             sys.stdout.write(f"  * SingleSite: {single_site.site_id}: {single_site.domain}.\n")
-        site_obj = get_or_create_site_obj(single_site, apps)
+        site_obj, site_changed = get_or_create_site_obj(single_site, apps)
+        _, profile_changed = get_or_create_site_profile_obj(single_site, site_obj, apps)
         if verbose:
-            sys.stdout.write(f"    - Site model: {site_obj.id}: {site_obj.domain}.\n")
-        get_or_create_site_profile_obj(single_site, site_obj, apps)
+            status = "" if site_changed or profile_changed else " (unchanged)"
+            sys.stdout.write(f"    - Site model: {site_obj.id}: {site_obj.domain}{status}.\n")
     return single_sites
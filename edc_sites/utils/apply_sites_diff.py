@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.apps import apps as django_apps
+from django.db import transaction
+
+from .get_or_create_site_obj import get_or_create_site_obj
+from .get_or_create_site_profile_obj import get_or_create_site_profile_obj
+
+if TYPE_CHECKING:
+    from .get_sites_diff import SitesDiff
+
+
+def apply_sites_diff(diff: SitesDiff, apps: django_apps | None = None) -> int:
+    """Applies only the inserts, updates and deletes in the SitesDiff
+    and returns the number of SingleSites changed.
+
+    Rows are saved one by one so that `post_save` receivers (e.g.
+    multisite alias sync) still run for the changed sites.
+    """
+    changed = 0
+    apps = apps or django_apps
+    site_model_cls = apps.get_model("sites", "Site")
+    with transaction.atomic():
+        if diff.site_deletes:
+            site_model_cls.objects.filter(
+                id__in=[site_id for site_id, _ in diff.site_deletes]
+            ).delete()
+        for single_site in diff.changed_single_sites:
+            site_obj, site_changed = get_or_create_site_obj(single_site, apps)
+            _, profile_changed = get_or_create_site_profile_obj(single_site, site_obj, apps)
+            changed += site_changed or profile_changed
+    return changed
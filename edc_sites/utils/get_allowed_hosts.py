@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+
+from ..single_site import SingleSite
+from .insert_into_domain import get_uat_variant
+
+__all__ = ["AllowedHosts", "get_allowed_hosts"]
+
+
+@dataclass
+class AllowedHosts:
+    hosts: list[str]
+    domains: list[str]
+
+    @property
+    def ratio(self) -> float:
+        """Returns the number of hosts per domain covered."""
+        return len(self.hosts) / len(self.domains) if self.domains else 1.0
+
+    def __str__(self):
+        return (
+            f"{len(self.domains)} domains in {len(self.hosts)} hosts "
+            f"(compaction ratio {self.ratio:.2f})"
+        )
+
+
+def is_covered(host: str, wildcard: str) -> bool:
+    """Returns True if `host` matches the ALLOWED_HOSTS wildcard,
+    e.g. `.bw.clinicedc.org`.
+    """
+    return host == wildcard[1:] or host.endswith(wildcard)
+
+
+def get_allowed_hosts(
+    single_sites: list[SingleSite] | None = None,
+    include_uat: bool | None = None,
+    compact: bool | None = None,
+    min_siblings: int | None = None,
+    min_parent_labels: int | None = None,
+) -> AllowedHosts:
+    """Returns an AllowedHosts instance with a deduplicated list of
+    hosts for settings.ALLOWED_HOSTS from the registered domains.
+
+    If `include_uat`, the UAT (or live) variant of each domain is
+    added. See `insert_into_domain`.
+
+    If `compact`, sibling domains are collapsed into a `.parent`
+    wildcard if there are at least `min_siblings` (default 2) and
+    the parent has at least `min_parent_labels` (default 3) labels.
+    For example, `mochudi.bw.clinicedc.org` and
+    `gaborone.bw.clinicedc.org` become `.bw.clinicedc.org` but
+    nothing is collapsed into `.clinicedc.org`.
+    """
+    from ..site import Sites, sites  # prevent circular import
+
+    single_sites = sites.all(aslist=True) if single_sites is None else single_sites
+    min_siblings = 2 if min_siblings is None else min_siblings
+    min_parent_labels = 3 if min_parent_labels is None else min_parent_labels
+    domains = set()
+    for single_site in single_sites:
+        if not single_site.domain:
+            continue
+        domain = single_site.domain.lower().split(":")[0]
+        domains.add(domain)
+        if include_uat:
+            domains.add(get_uat_variant(domain, Sites.uat_subdomain))
+    domains = sorted(domains)
+    if not compact:
+        return AllowedHosts(hosts=domains, domains=domains)
+    siblings = defaultdict(list)
+    for domain in domains:
+        _, _, parent = domain.partition(".")
+        if len(parent.split(".")) >= min_parent_labels:
+            siblings[parent].append(domain)
+    wildcards = sorted(
+        [
+            f".{parent}"
+            for parent, children in siblings.items()
+            if len(children) >= min_siblings
+        ],
+        key=len,
+    )
+    # drop wildcards covered by a shorter wildcard
+    compacted = []
+    for wildcard in wildcards:
+        if not any(is_covered(wildcard[1:], w) for w in compacted):
+            compacted.append(wildcard)
+    hosts = compacted + [d for d in domains if not any(is_covered(d, w) for w in compacted)]
+    return AllowedHosts(hosts=sorted(hosts), domains=domains)
@@ -1,8 +1,9 @@
-from django.contrib import messages
 from django.utils.translation import gettext as _
 
 
 def get_message_text(level: int) -> str:
+    from django.contrib import messages
+
     if level == messages.WARNING:
         return _(
             "You have permissions to view forms and data from sites other than the current. "
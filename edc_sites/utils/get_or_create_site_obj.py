@@ -8,10 +8,18 @@ from django.core.exceptions import ObjectDoesNotExist
 from ..single_site import SiteDomainRequiredError
 
 if TYPE_CHECKING:
+    from django.contrib.sites.models import Site
+
     from ..single_site import SingleSite
 
 
-def get_or_create_site_obj(single_site: SingleSite, apps):
+def get_or_create_site_obj(single_site: SingleSite, apps) -> tuple[Site, bool]:
+    """Returns a tuple of (Site, changed) where `changed` is True if
+    the Site was created or updated.
+
+    An existing Site is only saved if `name` or `domain` differ and
+    then only the changed fields are saved.
+    """
     if "multisite" in settings.INSTALLED_APPS and not single_site.domain:
         raise SiteDomainRequiredError(
             f"Domain required when using `multisite`. Got None for `{single_site.name}`"
@@ -23,8 +31,12 @@ def get_or_create_site_obj(single_site: SingleSite, apps):
         site_obj = site_model_cls.objects.create(
             pk=single_site.site_id, name=single_site.name, domain=single_site.domain
         )
-    else:
-        site_obj.name = single_site.name
-        site_obj.domain = single_site.domain
-        site_obj.save()
-    return site_obj
+        return site_obj, True
+    update_fields = []
+    for k, v in dict(name=single_site.name, domain=single_site.domain).items():
+        if getattr(site_obj, k) != v:
+            setattr(site_obj, k, v)
+            update_fields.append(k)
+    if update_fields:
+        site_obj.save(update_fields=update_fields)
+    return site_obj, bool(update_fields)
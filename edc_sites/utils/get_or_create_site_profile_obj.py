@@ -9,20 +9,35 @@ if TYPE_CHECKING:
     from ..models import SiteProfile
 
 
-def get_or_create_site_profile_obj(single_site, site_obj, apps) -> SiteProfile | None:
-    site_profile_model_cls = apps.get_model("edc_sites", "SiteProfile")
-    opts = dict(
+def get_site_profile_opts(single_site) -> dict:
+    """Returns the SiteProfile field values for this SingleSite."""
+    return dict(
         title=single_site.description,
         country=single_site.country,
         country_code=single_site.country_code,
         languages=json.dumps(single_site.languages) if single_site.languages else None,
     )
+
+
+def get_or_create_site_profile_obj(single_site, site_obj, apps) -> tuple[SiteProfile, bool]:
+    """Returns a tuple of (SiteProfile, changed) where `changed` is
+    True if the SiteProfile was created or updated.
+
+    An existing SiteProfile is only saved if a field differs and then
+    only the changed fields are saved.
+    """
+    site_profile_model_cls = apps.get_model("edc_sites", "SiteProfile")
+    opts = get_site_profile_opts(single_site)
     try:
         site_profile = site_profile_model_cls.objects.get(site=site_obj)
     except ObjectDoesNotExist:
         site_profile = site_profile_model_cls.objects.create(site=site_obj, **opts)
-    else:
-        for k, v in opts.items():
+        return site_profile, True
+    update_fields = []
+    for k, v in opts.items():
+        if getattr(site_profile, k) != v:
             setattr(site_profile, k, v)
-        site_profile.save()
-    return site_profile
+            update_fields.append(k)
+    if update_fields:
+        site_profile.save(update_fields=update_fields)
+    return site_profile, bool(update_fields)
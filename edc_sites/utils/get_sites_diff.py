@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from django.apps import apps as django_apps
+
+from ..single_site import SingleSite
+from .get_or_create_site_profile_obj import get_site_profile_opts
+
+__all__ = ["SitesDiff", "get_sites_diff"]
+
+
+@dataclass
+class SitesDiff:
+    """Differences between the `sites` registry and the Site and
+    SiteProfile tables.
+
+    Updates are a list of (SingleSite, {fieldname: (old, new)}).
+    """
+
+    site_inserts: list[SingleSite] = field(default_factory=list)
+    site_updates: list[tuple[SingleSite, dict]] = field(default_factory=list)
+    profile_inserts: list[SingleSite] = field(default_factory=list)
+    profile_updates: list[tuple[SingleSite, dict]] = field(default_factory=list)
+    # rows to delete, e.g. the default "example.com" site
+    site_deletes: list[tuple[int, str]] = field(default_factory=list)
+    # rows not in the registry, reported but not deleted
+    unregistered: list[tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(
+            self.site_inserts
+            or self.site_updates
+            or self.profile_inserts
+            or self.profile_updates
+            or self.site_deletes
+        )
+
+    @property
+    def changed_single_sites(self) -> list[SingleSite]:
+        """Returns a list of SingleSites with an insert or update
+        on either table, ordered by site_id.
+        """
+        changed = {s.site_id: s for s in self.site_inserts + self.profile_inserts}
+        changed.update({s.site_id: s for s, _ in self.site_updates + self.profile_updates})
+        return [changed[site_id] for site_id in sorted(changed)]
+
+    def as_lines(self) -> list[str]:
+        lines = []
+        for single_site in self.site_inserts:
+            lines.append(f"+ Site {single_site.site_id}: {single_site.domain}")
+        for single_site, changes in self.site_updates:
+            for attr, (old, new) in changes.items():
+                lines.append(f"~ Site {single_site.site_id}: {attr} `{old}` -> `{new}`")
+        for single_site in self.profile_inserts:
+            lines.append(f"+ SiteProfile {single_site.site_id}: {single_site.description}")
+        for single_site, changes in self.profile_updates:
+            for attr, (old, new) in changes.items():
+                lines.append(f"~ SiteProfile {single_site.site_id}: {attr} `{old}` -> `{new}`")
+        for site_id, domain in self.site_deletes:
+            lines.append(f"- Site {site_id}: {domain}")
+        for site_id, domain in self.unregistered:
+            lines.append(f"? Site {site_id}: {domain} is not registered (not deleted)")
+        return lines
+
+
+def get_sites_diff(
+    apps: django_apps | None = None,
+    single_sites: list[SingleSite] | tuple[SingleSite] = None,
+) -> SitesDiff:
+    """Returns a SitesDiff comparing the registered SingleSites with
+    the Site and SiteProfile tables in two queries.
+
+    See also: add_or_update_django_sites, apply_sites_diff.
+    """
+    from ..site import sites  # prevent circular import
+
+    apps = apps or django_apps
+    site_model_cls = apps.get_model("sites", "Site")
+    site_profile_model_cls = apps.get_model("edc_sites", "SiteProfile")
+    if not single_sites:
+        single_sites = sites.all(aslist=True)
+    single_sites = [s for s in single_sites if s.name != "edc_sites.sites"]
+    site_rows = {
+        row["id"]: row for row in site_model_cls.objects.values("id", "name", "domain")
+    }
+    profile_rows = {
+        row["site_id"]: row
+        for row in site_profile_model_cls.objects.values(
+            "site_id", "title", "country", "country_code", "languages"
+        )
+    }
+    diff = SitesDiff()
+    for single_site in single_sites:
+        if row := site_rows.get(single_site.site_id):
+            if changes := {
+                attr: (row[attr], getattr(single_site, attr))
+                for attr in ["name", "domain"]
+                if row[attr] != getattr(single_site, attr)
+            }:
+                diff.site_updates.append((single_site, changes))
+        else:
+            diff.site_inserts.append(single_site)
+        opts = get_site_profile_opts(single_site)
+        if row := profile_rows.get(single_site.site_id):
+            if changes := {k: (row[k], v) for k, v in opts.items() if row[k] != v}:
+                diff.profile_updates.append((single_site, changes))
+        else:
+            diff.profile_inserts.append(single_site)
+    registered_ids = [s.site_id for s in single_sites]
+    for site_id, row in site_rows.items():
+        if site_id in registered_ids:
+            continue
+        elif row["name"] == "example.com":
+            diff.site_deletes.append((site_id, row["domain"]))
+        else:
+            diff.unregistered.append((site_id, row["domain"]))
+    return diff
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from django.contrib.auth import get_user_model
 from django.core.exceptions import ImproperlyConfigured
 
 if TYPE_CHECKING:
@@ -16,6 +15,7 @@ def has_profile_or_raise(user: User) -> bool:
     `UserProfile` relation is set up in edc_auth. If `userprofile`
     relation is missing, confirm `edc_auth` is in INSTALLED_APPS.
     """
+    from django.contrib.auth import get_user_model
 
     user = get_user_model().objects.get(id=user.id)
     userprofile = getattr(user, "userprofile", None)
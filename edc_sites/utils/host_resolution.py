@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import socket
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable
+
+__all__ = ["HostResolution", "resolve_hosts", "validate_resolve_options"]
+
+
+@dataclass
+class HostResolution:
+    domain: str
+    address: str | None = None
+    error: str | None = None
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.address is not None
+
+
+def validate_resolve_options(
+    concurrency: int | None = None, timeout: float | None = None
+) -> tuple[int, float]:
+    """Returns the concurrency and timeout for `resolve_hosts` with
+    defaults applied or raises ValueError.
+    """
+    concurrency = 20 if concurrency is None else concurrency
+    timeout = 5.0 if timeout is None else timeout
+    if concurrency < 1:
+        raise ValueError(f"Invalid concurrency. Expected 1 or more. Got {concurrency}.")
+    if timeout <= 0:
+        raise ValueError(f"Invalid timeout. Expected more than 0. Got {timeout}.")
+    return concurrency, timeout
+
+
+def resolve_host(domain: str, resolver: Callable[[str], str]) -> HostResolution:
+    start = perf_counter()
+    try:
+        address = resolver(domain)
+    except OSError as e:
+        return HostResolution(domain=domain, error=str(e), latency=perf_counter() - start)
+    return HostResolution(domain=domain, address=address, latency=perf_counter() - start)
+
+
+def resolve_hosts(
+    domains: list[str],
+    resolver: Callable[[str], str] | None = None,
+    concurrency: int | None = None,
+    timeout: float | None = None,
+) -> list[HostResolution]:
+    """Resolves domains concurrently and returns a list of
+    HostResolution in the same order as `domains`.
+
+    `resolver` takes a domain and returns an address or raises
+    OSError (default: `socket.gethostbyname`). Lookups run in a pool
+    of `concurrency` threads (default: 20). Lookups not done within
+    `timeout` seconds (default: 5.0) of the first lookup are reported
+    as errors; their threads are not waited for and end when the
+    lookup returns.
+    """
+    concurrency, timeout = validate_resolve_options(concurrency, timeout)
+    resolver = resolver or socket.gethostbyname
+    start = perf_counter()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        futures = [executor.submit(resolve_host, domain, resolver) for domain in domains]
+        wait(futures, timeout=timeout)
+    finally:
+        # do not wait for abandoned lookups, do not start queued ones
+        executor.shutdown(wait=False, cancel_futures=True)
+    return [
+        (
+            future.result()
+            if future.done() and not future.cancelled()
+            else HostResolution(
+                domain=domain,
+                error=f"timed out after {timeout}s",
+                latency=perf_counter() - start,
+            )
+        )
+        for domain, future in zip(domains, futures)
+    ]
@@ -3,3 +3,14 @@ def insert_into_domain(domain: str, subdomain: str):
     if subdomain not in as_list:
         as_list.insert(1, subdomain)  # after the site name
     return ".".join(as_list)
+
+
+def get_uat_variant(domain: str, subdomain: str) -> str:
+    """Returns the live domain if `domain` includes the UAT subdomain,
+    otherwise the UAT domain.
+    """
+    as_list = domain.split(".")
+    if subdomain in as_list:
+        as_list.remove(subdomain)
+        return ".".join(as_list)
+    return insert_into_domain(domain, subdomain)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from django.apps import apps as django_apps
+from django.db import transaction
+
+from ..single_site import SingleSite
+from .insert_into_domain import get_uat_variant
+
+__all__ = ["AliasSyncResult", "get_registry_aliases", "sync_multisite_aliases"]
+
+
+@dataclass
+class AliasSyncResult:
+    created: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+    def __str__(self):
+        return f"created={self.created}, deleted={self.deleted}, unchanged={self.unchanged}"
+
+
+def get_registry_aliases(
+    single_sites: list[SingleSite], include_uat: bool | None = None
+) -> dict[str, tuple[int, bool | None]]:
+    """Returns a dict of {domain: (site_id, is_canonical)} for the
+    given SingleSites.
+
+    The registered domain is the canonical alias. If `include_uat`,
+    the UAT (or live) variant of the domain is added as a
+    non-canonical alias.
+    """
+    from ..site import Sites  # prevent circular import
+
+    aliases = {}
+    for single_site in single_sites:
+        if not single_site.domain:
+            continue
+        aliases.update({single_site.domain.lower(): (single_site.site_id, True)})
+        if include_uat:
+            domain = get_uat_variant(single_site.domain.lower(), Sites.uat_subdomain)
+            aliases.setdefault(domain, (single_site.site_id, None))
+    return aliases
+
+
+def sync_multisite_aliases(
+    single_sites: list[SingleSite] | None = None,
+    include_uat: bool | None = None,
+    apps: django_apps | None = None,
+) -> AliasSyncResult:
+    """Creates and deletes multisite `Alias` rows for the registered
+    sites with bulk operations in one transaction.
+
+    Stale canonical aliases are deleted. Other non-canonical aliases,
+    e.g. added in the admin, and aliases of sites not in the registry
+    are kept unless they use a registered domain. An alias whose site
+    or `is_canonical` changed is deleted and recreated.
+    Expects the Site table to be up to date.
+    """
+    from ..site import sites  # prevent circular import
+
+    apps = apps or django_apps
+    alias_model_cls = apps.get_model("multisite", "Alias")
+    single_sites = single_sites or sites.all(aslist=True)
+    expected = get_registry_aliases(single_sites, include_uat=include_uat)
+    site_ids = [s.site_id for s in single_sites]
+    result = AliasSyncResult()
+    with transaction.atomic():
+        existing = alias_model_cls.objects.filter(site_id__in=site_ids).values_list(
+            "id", "domain", "site_id", "is_canonical"
+        )
+        delete_ids = []
+        for pk, domain, site_id, is_canonical in existing:
+            if expected.get(domain.lower()) == (site_id, is_canonical):
+                expected.pop(domain.lower())
+                result.unchanged += 1
+            elif domain.lower() in expected or is_canonical:
+                delete_ids.append(pk)
+        # aliases for unregistered sites that use a registered domain
+        delete_ids.extend(
+            alias_model_cls.objects.filter(domain__in=list(expected))
+            .exclude(id__in=delete_ids)
+            .values_list("id", flat=True)
+        )
+        if delete_ids:
+            result.deleted, _ = alias_model_cls.objects.filter(id__in=delete_ids).delete()
+        alias_model_cls.objects.bulk_create(
+            [
+                alias_model_cls(domain=domain, site_id=site_id, is_canonical=is_canonical)
+                for domain, (site_id, is_canonical) in expected.items()
+            ]
+        )
+        result.created = len(expected)
+    return result
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Type
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+__all__ = ["ExportedFile", "export_site_data"]
+
+CSV = "csv"
+JSONL = "jsonl"
+SITE = "site"
+COUNTRY = "country"
+UNREGISTERED = "unregistered"
+
+
+@dataclass
+class ExportedFile:
+    path: Path
+    partition: str
+    site_ids: list[int] = field(default_factory=list)
+    rows: int = 0
+    elapsed: float = 0.0
+
+
+def get_export_fieldnames(model_cls: Type[Model]) -> list[str]:
+    """Returns the concrete field attnames, e.g. `site_id`."""
+    return [f.attname for f in model_cls._meta.concrete_fields]
+
+
+def write_rows(path: Path, rows, fieldnames: list[str], fmt: str) -> int:
+    count = 0
+    with path.open("w", newline="", encoding="utf-8") as f:
+        if fmt == CSV:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        else:
+            for row in rows:
+                f.write(json.dumps(dict(zip(fieldnames, row)), cls=DjangoJSONEncoder))
+                f.write("\n")
+                count += 1
+    return count
+
+
+def export_site_data(
+    model_cls: Type[Model],
+    path: str | Path,
+    fmt: str | None = None,
+    partition: str | None = None,
+    site_ids: list[int] | None = None,
+    fieldnames: list[str] | None = None,
+    chunk_size: int | None = None,
+    using: str | None = None,
+) -> list[ExportedFile]:
+    """Writes the rows of a model declared with `SiteModelMixin` to
+    one CSV or JSONL file per site or per country and returns a list
+    of ExportedFile.
+
+    Rows are streamed with `iterator(chunk_size=...)` one partition
+    at a time so memory use does not depend on the size of the
+    table. Files are named `<app_label>_<model_name>_<site_id or
+    country>.<fmt>` in the `path` folder.
+
+    If `site_ids` is None, rows with a NULL or unregistered site_id
+    are written to an `unregistered` partition.
+    """
+    from ..site import sites  # prevent circular import
+
+    fmt = fmt or CSV
+    partition = partition or SITE
+    if fmt not in [CSV, JSONL]:
+        raise ValueError(f"Invalid format. Expected one of {[CSV, JSONL]}. Got `{fmt}`.")
+    if partition not in [SITE, COUNTRY]:
+        raise ValueError(
+            f"Invalid partition. Expected one of {[SITE, COUNTRY]}. Got `{partition}`."
+        )
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    fieldnames = fieldnames or get_export_fieldnames(model_cls)
+    single_sites = sorted(sites.all(aslist=True), key=lambda s: s.site_id)
+    if site_ids is not None:
+        single_sites = [s for s in single_sites if s.site_id in site_ids]
+    partitions: dict[str, list[int]] = {}
+    for single_site in single_sites:
+        key = str(single_site.site_id) if partition == SITE else single_site.country
+        partitions.setdefault(key, []).append(single_site.site_id)
+    lookups = {
+        key: Q(site_id__in=partition_site_ids)
+        for key, partition_site_ids in partitions.items()
+    }
+    if site_ids is None:
+        partitions[UNREGISTERED] = []
+        lookups[UNREGISTERED] = Q(site_id__isnull=True) | ~Q(
+            site_id__in=[s.site_id for s in single_sites]
+        )
+    prefix = model_cls._meta.label_lower.replace(".", "_")
+    exported_files = []
+    for key, partition_site_ids in partitions.items():
+        start = perf_counter()
+        queryset = (
+            model_cls._base_manager.using(using)
+            .filter(lookups[key])
+            .order_by("site_id", "pk")
+            .values_list(*fieldnames)
+        )
+        filename = path / f"{prefix}_{key}.{fmt}"
+        rows = write_rows(
+            filename, queryset.iterator(chunk_size=chunk_size or 2000), fieldnames, fmt
+        )
+        exported_files.append(
+            ExportedFile(
+                path=filename,
+                partition=key,
+                site_ids=partition_site_ids,
+                rows=rows,
+                elapsed=perf_counter() - start,
+            )
+        )
+    return exported_files
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Type
+
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Count
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from django.db.models import Model
+
+__all__ = ["SiteRowCounts", "get_site_model_mixin_models", "get_site_row_counts"]
+
+
+def get_site_row_counts_timeout() -> int:
+    """Returns the number of seconds to cache the row counts."""
+    return getattr(settings, "EDC_SITES_ROW_COUNTS_TIMEOUT", 300)
+
+
+@dataclass
+class SiteRowCounts:
+    """Row counts per model per site.
+
+    `counts` is a dict of {label_lower: {site_id: count}}.
+    """
+
+    counts: dict[str, dict[int | None, int]] = field(default_factory=dict)
+    created: datetime | None = None
+    elapsed: float = 0.0
+
+    def by_site(self) -> dict[int | None, int]:
+        """Returns a dict of {site_id: rows} over all models."""
+        totals = {}
+        for site_counts in self.counts.values():
+            for site_id, count in site_counts.items():
+                totals[site_id] = totals.get(site_id, 0) + count
+        return dict(sorted(totals.items(), key=lambda x: (x[0] is None, x[0])))
+
+    def by_model(self) -> dict[str, int]:
+        """Returns a dict of {label_lower: rows} over all sites."""
+        return {label: sum(site_counts.values()) for label, site_counts in self.counts.items()}
+
+
+def get_site_model_mixin_models() -> list[Type[Model]]:
+    """Returns the concrete, non-proxy models declared with
+    `SiteModelMixin`.
+    """
+    from ..model_mixins import SiteModelMixin  # prevent circular import
+
+    return [
+        model_cls
+        for model_cls in django_apps.get_models()
+        if issubclass(model_cls, SiteModelMixin) and not model_cls._meta.proxy
+    ]
+
+
+def count_rows_by_site(model_cls: Type[Model], using: str) -> dict[int | None, int]:
+    """Returns a dict of {site_id: count} for this model in one
+    GROUP BY query.
+    """
+    queryset = (
+        model_cls._base_manager.using(using)
+        .order_by()
+        .values_list("site_id")
+        .annotate(count=Count("pk"))
+    )
+    return dict(queryset)
+
+
+def count_rows_by_site_in_thread(model_cls: Type[Model], using: str) -> dict[int | None, int]:
+    try:
+        return count_rows_by_site(model_cls, using)
+    finally:
+        connections.close_all()
+
+
+def get_site_row_counts(
+    models: list[Type[Model]] | None = None,
+    using: str | None = None,
+    max_workers: int | None = None,
+    refresh: bool | None = None,
+) -> SiteRowCounts:
+    """Returns a SiteRowCounts for the models declared with
+    `SiteModelMixin` using one aggregated query per model.
+
+    If `max_workers` > 1, the queries run in a thread pool, one DB
+    connection per thread. Unless `models` is given, the result is
+    cached for settings.EDC_SITES_ROW_COUNTS_TIMEOUT seconds
+    (default: 300). Set `refresh` to ignore the cached value.
+    """
+    using = using or DEFAULT_DB_ALIAS
+    cache_key = f"edc_sites.site_row_counts.{using}" if models is None else None
+    if cache_key and not refresh and (row_counts := cache.get(cache_key)):
+        return row_counts
+    models = models if models is not None else get_site_model_mixin_models()
+    start = perf_counter()
+    if max_workers and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(
+                    lambda model_cls: count_rows_by_site_in_thread(model_cls, using), models
+                )
+            )
+    else:
+        results = [count_rows_by_site(model_cls, using) for model_cls in models]
+    row_counts = SiteRowCounts(
+        counts={
+            model_cls._meta.label_lower: site_counts
+            for model_cls, site_counts in zip(models, results)
+        },
+        created=timezone.now(),
+        elapsed=perf_counter() - start,
+    )
+    if cache_key:
+        cache.set(cache_key, row_counts, get_site_row_counts_timeout())
+    return row_counts
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable
+
+from django.apps import apps as django_apps
+from django.db import connections
+
+from ..single_site import SingleSite
+
+__all__ = ["SiteRunResult", "SitesRunResult", "run_for_sites"]
+
+THREAD = "thread"
+PROCESS = "process"
+
+
+@dataclass
+class SiteRunResult:
+    site_id: int
+    result: Any = None
+    error: str | None = None
+    traceback: str | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class SitesRunResult:
+    results: list[SiteRunResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return all(r.ok for r in self.results)
+
+    @property
+    def errors(self) -> list[SiteRunResult]:
+        return [r for r in self.results if not r.ok]
+
+    def as_dict(self) -> dict[int, Any]:
+        """Returns a dict of {site_id: result} for sites that did
+        not raise.
+        """
+        return {r.site_id: r.result for r in self.results if r.ok}
+
+    def __str__(self):
+        return (
+            f"sites={len(self.results)}, errors={len(self.errors)}, "
+            f"elapsed={self.elapsed:.3f}s"
+        )
+
+
+# DB connections a forked worker inherited from the caller
+inherited_connections: list = []
+
+
+def init_process_worker() -> None:
+    """Sets up django in a spawned worker process.
+
+    Forked workers inherit the app registry and `sites` as well as
+    the caller's DB connections, which share their sockets with the
+    caller. Closing one would end the caller's DB session, e.g. on
+    PostgreSQL or MySQL, so the inherited connections are not closed
+    but set aside for the life of the worker. The worker opens its
+    own connections when it first queries the DB.
+    """
+    if not django_apps.ready:
+        import django
+
+        django.setup()
+    for conn in connections.all(initialized_only=True):
+        inherited_connections.append(conn)
+        del connections[conn.alias]
+
+
+def run_for_site(
+    single_site: SingleSite,
+    func: Callable[..., Any] = None,
+    args: tuple | None = None,
+    kwargs: dict | None = None,
+) -> SiteRunResult:
+    """Calls `func(single_site, *args, **kwargs)` with `single_site`
+    as the current site and returns a SiteRunResult.
+
+    DB connections opened by this worker are closed when done.
+    """
+    from ..site import sites  # prevent circular import
+
+    start = perf_counter()
+    site_result = SiteRunResult(site_id=single_site.site_id)
+    try:
+        with sites.use_site(single_site.site_id):
+            site_result.result = func(single_site, *(args or ()), **(kwargs or {}))
+    except Exception as e:
+        site_result.error = f"{e.__class__.__name__}: {e}"
+        site_result.traceback = traceback.format_exc()
+    finally:
+        connections.close_all()
+    site_result.elapsed = perf_counter() - start
+    return site_result
+
+
+def run_for_sites(
+    func: Callable[..., Any],
+    *args,
+    site_ids: list[int] | None = None,
+    country: str | None = None,
+    executor: str | None = None,
+    max_workers: int | None = None,
+    **kwargs,
+) -> SitesRunResult:
+    """Runs `func(single_site, *args, **kwargs)` once per registered
+    site in a thread or process pool and returns a SitesRunResult
+    ordered by site_id.
+
+    * Limit to `site_ids` and/or to the sites of a `country`.
+    * The current site is set per call with `sites.use_site` so
+      `SiteModelMixin` and the `on_site` manager use that site.
+    * An exception raised by `func` is reported in the result for
+      that site and does not stop the other sites.
+    * For `executor="process"`, `func`, its arguments and return
+      value must be picklable. Each worker process opens its own
+      DB connections; the connections inherited from the caller are
+      not used or closed.
+
+    For example:
+
+        def count_subjects(single_site):
+            return SubjectConsent.on_site.count()
+
+        result = run_for_sites(count_subjects, country="botswana")
+        result.as_dict()  # {10: 121, 20: 98, ...}
+    """
+    from ..site import sites  # prevent circular import
+
+    executor = executor or THREAD
+    if executor not in [THREAD, PROCESS]:
+        raise ValueError(
+            f"Invalid executor. Expected one of {[THREAD, PROCESS]}. Got `{executor}`."
+        )
+    if country:
+        single_sites = sites.get_by_country(country, aslist=True)
+    else:
+        single_sites = sites.all(aslist=True)
+    if site_ids is not None:
+        single_sites = [s for s in single_sites if s.site_id in site_ids]
+    single_sites = sorted(single_sites, key=lambda s: s.site_id)
+    start = perf_counter()
+    if executor == PROCESS:
+        pool = ProcessPoolExecutor(max_workers=max_workers, initializer=init_process_worker)
+    else:
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+    with pool:
+        results = list(
+            pool.map(partial(run_for_site, func=func, args=args, kwargs=kwargs), single_sites)
+        )
+    return SitesRunResult(results=results, elapsed=perf_counter() - start)
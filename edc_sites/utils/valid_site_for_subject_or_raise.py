@@ -3,11 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from warnings import warn
 
-from edc_registration import get_registered_subject
-from edc_registration.utils import RegisteredSubjectDoesNotExist
-
 from ..exceptions import InvalidSiteForSubjectError
-from .get_site_model_cls import get_site_model_cls
 
 if TYPE_CHECKING:
     from django.contrib.sites.models import Site
@@ -25,6 +21,11 @@ def valid_site_for_subject_or_raise(
     * Confirms by querying RegisteredSubject.
     * If subject_identifier is invalid will raise ObjectDoesNotExist
     """
+    from edc_registration import get_registered_subject
+    from edc_registration.utils import RegisteredSubjectDoesNotExist
+
+    from ..current_site import get_current_site_obj  # prevent circular import
+
     registered_subject: RegisteredSubject | None = get_registered_subject(
         subject_identifier, raise_exception=True
     )
@@ -32,7 +33,7 @@ def valid_site_for_subject_or_raise(
         warn("Skipping validation of current site against registered subject site.")
         current_site = registered_subject.site
     else:
-        current_site: Site = get_site_model_cls().objects.get_current()
+        current_site: Site = get_current_site_obj()
         try:
             registered_subject = get_registered_subject(
                 subject_identifier,
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+import os
+from argparse import ArgumentParser
+
+import django
+from django.test.runner import DiscoverRunner
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args, _ = parser.parse_known_args()
+    os.environ["DJANGO_SETTINGS_MODULE"] = "edc_sites.tests.test_settings"
+    django.setup()
+
+    from edc_sites.tests.benchmarks import main
+
+    runner = DiscoverRunner(verbosity=0)
+    runner.setup_test_environment()
+    old_config = runner.setup_databases()
+    try:
+        main(repeat=args.repeat)
+    finally:
+        runner.teardown_databases(old_config)
+        runner.teardown_test_environment()